@@ -0,0 +1,42 @@
+import hpx
+import sys
+
+NUM_MESSAGES = 10000
+
+@hpx.create_action()
+def plain_message(value):
+    return hpx.SUCCESS
+
+@hpx.create_action(coalesced=True)
+def coalesced_message(value):
+    return hpx.SUCCESS
+
+@hpx.create_action()
+def worker(current_rank, num_ranks, coalesced, and_lco):
+    message_action = coalesced_message if coalesced else plain_message
+    for i in range(NUM_MESSAGES):
+        target_rank = (current_rank + i) % num_ranks
+        message_action(hpx.THERE(target_rank), i, rsync_lco=and_lco)
+    return hpx.SUCCESS
+
+def run_alltoall(coalesced, num_ranks):
+    start = hpx.time_now()
+    and_lco = hpx.And(num_ranks*NUM_MESSAGES)
+    for i in range(num_ranks):
+        worker(hpx.THERE(i), i, num_ranks, coalesced, and_lco)
+    and_lco.wait()
+    elapsed = hpx.time_elapsed_ms(start)
+    and_lco.delete()
+    return num_ranks*NUM_MESSAGES / (elapsed / 1000.0)
+
+@hpx.create_action()
+def main():
+    num_ranks = hpx.get_num_ranks()
+    print("plain: {0:.0f} messages/s".format(run_alltoall(False, num_ranks)))
+    print("coalesced: {0:.0f} messages/s".format(run_alltoall(True, num_ranks)))
+    hpx.exit()
+
+if __name__ == '__main__':
+    hpx.init(sys.argv, coalescing_buffer_size=512)
+    hpx.run(main)
+    hpx.finalize()
@@ -64,9 +64,8 @@ def main():
         generate_data(data[i], node_size(i), rsync_lco=generate_data_complete)
     generate_data_complete.wait()
     
-    data_this_block = data[0].try_pin()
-    centers = data_this_block[:K]
-    data[0].unpin()
+    with data[0].pinned() as data_this_block:
+        centers = data_this_block[:K].copy()
     iterations = 0
     while iterations < MAX_ITERATION:
         count_lco = hpx.Reduce(NUM_NODE, (K,), np.dtype(np.int), 
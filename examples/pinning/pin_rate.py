@@ -0,0 +1,28 @@
+import hpx
+import numpy as np
+import sys
+
+NUM_PINS = 100000
+
+def pins_per_second(block):
+    start = hpx.time_now()
+    for i in range(NUM_PINS):
+        block.try_pin()
+        block.unpin()
+    elapsed = hpx.time_elapsed_ms(start)
+    return NUM_PINS / (elapsed / 1000.0)
+
+@hpx.create_action()
+def main():
+    memory = hpx.GlobalMemory.alloc_local_at(4, (64, 64), np.dtype(np.float64), hpx.HERE())
+    print("contiguous block: {0:.0f} pins/s".format(pins_per_second(memory[0])))
+    print("strided block: {0:.0f} pins/s".format(pins_per_second(memory[0][:, 1:33])))
+    with hpx.PinCache():
+        print("pin cache: {0:.0f} pins/s".format(pins_per_second(memory[1])))
+    memory.free_sync()
+    hpx.exit()
+
+if __name__ == '__main__':
+    hpx.init(sys.argv)
+    hpx.run(main)
+    hpx.finalize()
@@ -0,0 +1,49 @@
+import hpx
+import numpy as np
+import sys
+import zlib
+
+# unbalanced tree search: the number of children of a node is drawn from a 
+# binomial distribution seeded by the node, so a few subtrees are much larger 
+# than the others
+ROOT_CHILDREN = 64
+CHILD_PROBABILITY = 0.2
+NUM_CHILDREN = 5
+MAX_DEPTH = 40
+
+@hpx.create_action()
+def visit(pool, counters, node, depth):
+    counters[hpx.get_my_rank()].addr.fetch_add(1)
+    if depth == 0:
+        num_children = ROOT_CHILDREN
+    elif depth < MAX_DEPTH:
+        rng = np.random.RandomState(zlib.crc32(node.encode('ascii')))
+        num_children = rng.binomial(NUM_CHILDREN, CHILD_PROBABILITY)
+    else:
+        num_children = 0
+    for i in range(num_children):
+        pool.push(visit, pool, counters, node + '.' + str(i), depth + 1)
+
+@hpx.create_action()
+def main():
+    num_ranks = hpx.get_num_ranks()
+    counters = hpx.GlobalMemory.calloc_cyclic(num_ranks, 1, np.dtype(np.int64))
+    pool = hpx.TaskPool()
+
+    start = hpx.time_now()
+    pool.run(visit, pool, counters, '0', 0)
+    elapsed = hpx.time_elapsed_ms(start)
+
+    nodes = counters.get().reshape(-1)
+    print("visited {0} nodes in {1:.1f} ms: {2:.0f} nodes/s".format(
+          nodes.sum(), elapsed, nodes.sum() / (elapsed / 1000.0)))
+    print("nodes per rank: {0}".format(nodes))
+
+    pool.free()
+    counters.free_sync()
+    hpx.exit()
+
+if __name__ == '__main__':
+    hpx.init(sys.argv)
+    hpx.run(main)
+    hpx.finalize()
@@ -75,23 +75,29 @@ def partition_node(node_gas, parts, n_parts, n_partition):
     node['count'] = n_parts
 
     if n_parts <= n_partition:
-        parts_local = parts[0].try_pin()
-        node['moments'] = compute_moments(parts_local, n_parts)
-        parts[0].unpin()
+        with parts[0].pinned() as parts_local:
+            node['moments'] = compute_moments(parts_local, n_parts)
         hpx.thread_continue('array', node['moments'])
     else:
-        parts_local = parts[0].try_pin()
-        split = 0.5*(node[0]['low'] + node[0]['high'])
-        parts_local_left = parts_local[parts_local['pos'] < split]
-        parts_local_right = parts_local[parts_local['pos'] >= split]
-        parts[0].unpin()
+        with parts[0].pinned() as parts_local:
+            split = 0.5*(node[0]['low'] + node[0]['high'])
+            parts_local_left = parts_local[parts_local['pos'] < split]
+            parts_local_right = parts_local[parts_local['pos'] >= split]
 
         reduce_lco = hpx.Reduce(2, (1,), moment_type, moment_reduction_id, moment_reduction_op)
         
+        # start the allocations of both children before copying any particles
         if parts_local_left.shape[0] > 0:
             node_left = create_node(node[0]['low'], split)
             node['left'] = node_left.addr.addr
-            parts_left = hpx.GlobalMemory.alloc_local_at(1, parts_local_left.shape[0], particle_type, node['left'])
+            parts_left_future = hpx.GlobalMemory.alloc_local_at(1, parts_local_left.shape[0], particle_type, node['left'], sync='async')
+        if parts_local_right.shape[0] > 0:
+            node_right = create_node(split, node[0]['high'])
+            node['right'] = node_right.addr.addr
+            parts_right_future = hpx.GlobalMemory.alloc_local_at(1, parts_local_right.shape[0], particle_type, node['right'], sync='async')
+
+        if parts_local_left.shape[0] > 0:
+            parts_left = parts_left_future.get()
             cpy_done = hpx.Future()
             parts_left[0].set(parts_local_left, sync='lsync', rsync_lco=cpy_done)
             cpy_done.wait()
@@ -102,9 +108,7 @@ def partition_node(node_gas, parts, n_parts, n_partition):
             reduce_lco.set(array=empty)
 
         if parts_local_right.shape[0] > 0:
-            node_right = create_node(split, node[0]['high'])
-            node['right'] = node_right.addr.addr
-            parts_right = hpx.GlobalMemory.alloc_local_at(1, parts_local_right.shape[0], particle_type, node['right'])
+            parts_right = parts_right_future.get()
             parts_right[0].set(parts_local_right)
             partition_node(node_right[0], node_right[0], parts_right, parts_local_right.shape[0], n_partition, rsync_lco=reduce_lco)
         else:
@@ -133,6 +137,7 @@ def spawn_computation(current, root, sync, theta): # (int, GlobalMemory, LCO, fl
         parts = parts_gas.try_pin()
         for i in range(node['count']):
             compute_and_save(hpx.HERE(), root, sync, parts_gas[i], parts[i]['pos'], theta)
+        compute_and_save.flush()
         parts_gas.unpin()
     else:
         if node['left'] != hpx.NULL().addr:
@@ -142,7 +147,7 @@ def spawn_computation(current, root, sync, theta): # (int, GlobalMemory, LCO, fl
         
     return hpx.SUCCESS
 
-@hpx.create_action()
+@hpx.create_action(coarsen=True)
 def compute_and_save(root, sync, current, pos, theta):
     compdone = hpx.Future(shape=(1,), dtype=np.dtype(float))
     node_compute_potential(root[0], root.addr.addr, pos, theta, rsync_lco=compdone)
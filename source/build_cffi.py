@@ -149,6 +149,11 @@ int64_t hpx_addr_sub(hpx_addr_t lhs, hpx_addr_t rhs, uint32_t bsize);
 /* Begin process.h */
 
 typedef hpx_addr_t hpx_pid_t;
+hpx_addr_t hpx_process_new(hpx_addr_t termination);
+void hpx_process_delete(hpx_addr_t process, hpx_addr_t sync);
+hpx_pid_t hpx_process_getpid(hpx_addr_t process);
+int _hpx_process_call(hpx_addr_t process, hpx_addr_t addr, hpx_action_t action,
+                      hpx_addr_t result, int nargs, ...);
 int _hpx_process_broadcast(hpx_pid_t pid, hpx_action_t action, hpx_addr_t lsync, hpx_addr_t rsync, int nargs, ...);
 int _hpx_process_broadcast_lsync(hpx_pid_t pid, hpx_action_t action, hpx_addr_t rsync, int nargs, ...);
 int _hpx_process_broadcast_rsync(hpx_pid_t pid, hpx_action_t action, int nargs, ...);
@@ -160,6 +165,8 @@ int _hpx_process_broadcast_rsync(hpx_pid_t pid, hpx_action_t action, int nargs,
 hpx_pid_t hpx_thread_current_pid(void);
 int _hpx_thread_continue(int n, ...);
 hpx_addr_t hpx_thread_current_target(void);
+void hpx_thread_yield(void);
+int hpx_thread_get_tls_id(void);
 
 /* End thread.h */
 
@@ -170,6 +177,18 @@ hpx_addr_t hpx_gas_alloc_local_at_sync(size_t n, uint32_t bsize, uint32_t bounda
                                        hpx_addr_t loc);
 void hpx_gas_alloc_local_at_async(size_t n, uint32_t bsize, uint32_t boundary,
                                   hpx_addr_t loc, hpx_addr_t lco);
+hpx_addr_t hpx_gas_alloc_blocked(size_t n, size_t bsize, uint32_t boundary);
+hpx_addr_t hpx_gas_calloc_blocked(size_t n, size_t bsize, uint32_t boundary);
+hpx_addr_t hpx_gas_calloc_local_at_sync(size_t n, uint32_t bsize, uint32_t boundary,
+                                        hpx_addr_t loc);
+void hpx_gas_calloc_local_at_async(size_t n, uint32_t bsize, uint32_t boundary,
+                                   hpx_addr_t loc, hpx_addr_t lco);
+typedef hpx_addr_t (*hpx_gas_dist_t)(uint32_t i, size_t n, uint32_t bsize);
+#define HPX_GAS_ATTR_NONE ...
+hpx_addr_t hpx_gas_alloc(size_t n, size_t bsize, uint32_t boundary,
+                         hpx_gas_dist_t dist, uint32_t attr);
+hpx_addr_t hpx_gas_calloc(size_t n, size_t bsize, uint32_t boundary,
+                          hpx_gas_dist_t dist, uint32_t attr);
 void hpx_gas_free(hpx_addr_t addr, hpx_addr_t rsync);
 void hpx_gas_free_sync(hpx_addr_t addr);
 bool hpx_gas_try_pin(hpx_addr_t addr, void **local);
@@ -181,6 +200,8 @@ int hpx_gas_memput(hpx_addr_t to, const void *from, size_t size,
 int hpx_gas_memput_lsync(hpx_addr_t to, const void *from, size_t size,
                          hpx_addr_t rsync);
 int hpx_gas_memput_rsync(hpx_addr_t to, const void *from, size_t size);
+int hpx_gas_memcpy(hpx_addr_t to, hpx_addr_t from, size_t size, hpx_addr_t sync);
+int hpx_gas_memcpy_sync(hpx_addr_t to, hpx_addr_t from, size_t size);
 
 /* End gas.h */
 
@@ -196,6 +217,7 @@ void hpx_lco_set(hpx_addr_t lco, size_t size, const void *value, hpx_addr_t lsyn
 void hpx_lco_set_lsync(hpx_addr_t lco, size_t size, const void *value, hpx_addr_t rsync);
 int hpx_lco_set_rsync(hpx_addr_t lco, size_t size, const void *value);
 hpx_status_t hpx_lco_wait(hpx_addr_t lco);
+void hpx_lco_reset_sync(hpx_addr_t lco);
 hpx_status_t hpx_lco_get(hpx_addr_t lco, size_t size, void *value);
 hpx_addr_t hpx_lco_reduce_new(int inputs, size_t size, hpx_action_t id, hpx_action_t op);
 
@@ -215,6 +237,34 @@ int _hpx_call_cc(hpx_addr_t addr, hpx_action_t action, int n, ...);
 
 /* End rpc.h */
 
+/* Begin pyhpx helpers */
+
+void pyhpx_addr_add_n(const hpx_addr_t *addrs, const int64_t *bytes, hpx_addr_t *out,
+                      size_t n, uint32_t bsize);
+int pyhpx_addr_owner_n(const hpx_addr_t *addrs, int *ranks, size_t n);
+int pyhpx_call_n(const hpx_addr_t *addrs, size_t n, hpx_action_t action, hpx_addr_t rsync,
+                 const void *args, size_t size);
+int pyhpx_gas_memget_v(void *to, const hpx_addr_t *from, const size_t *sizes, size_t n,
+                       hpx_addr_t lsync);
+int pyhpx_gas_memput_v(const hpx_addr_t *to, const void *from, const size_t *sizes, size_t n,
+                       hpx_addr_t lsync, hpx_addr_t rsync);
+int pyhpx_gas_memcpy_v(const hpx_addr_t *to, const hpx_addr_t *from, size_t size, size_t n,
+                       hpx_addr_t sync);
+void pyhpx_gas_unpin_n(const hpx_addr_t *addrs, size_t n);
+#define PYHPX_ATOMIC_SUM ...
+#define PYHPX_ATOMIC_MIN ...
+#define PYHPX_ATOMIC_MAX ...
+#define PYHPX_ATOMIC_INT64 ...
+#define PYHPX_ATOMIC_DOUBLE ...
+int pyhpx_atomic_fetch_op_n(const hpx_addr_t *addrs, int op, int type, const uint64_t *values,
+                            uint64_t *old, size_t n);
+int pyhpx_atomic_cas_n(const hpx_addr_t *addrs, const int64_t *expected,
+                       const int64_t *desired, int64_t *old, size_t n);
+int pyhpx_atomic_accumulate_n(const hpx_addr_t *addrs, int op, int type, const void *values,
+                              size_t count, size_t n, hpx_addr_t lsync, hpx_addr_t rsync);
+
+/* End pyhpx helpers */
+
 /* Begin time.h */
 
 typedef struct { ...; } hpx_time_t;
@@ -367,6 +417,310 @@ static void after_transfer_callback(void)
     }
 }
 
+// Wait for `gate` and signal `target` once. This is used to report the
+// completion of a batch of operations through a single LCO.
+static int _pyhpx_chain_handler(hpx_addr_t gate, hpx_addr_t target)
+{
+    hpx_status_t status = hpx_lco_wait(gate);
+    hpx_lco_delete_sync(gate);
+    if(status != HPX_SUCCESS) {
+        hpx_lco_error(target, status, HPX_NULL);
+    } else {
+        hpx_lco_set(target, 0, NULL, HPX_NULL, HPX_NULL);
+    }
+    return HPX_SUCCESS;
+}
+static HPX_ACTION(HPX_DEFAULT, 0, _pyhpx_chain, _pyhpx_chain_handler, HPX_ADDR, HPX_ADDR);
+
+// Get an LCO to use for `n` operations such that `sync` is signaled once 
+// when all of them complete.
+static hpx_addr_t _pyhpx_gather(size_t n, hpx_addr_t sync)
+{
+    if(sync == HPX_NULL || n == 1) {
+        return sync;
+    }
+    if(n == 0) {
+        hpx_lco_set(sync, 0, NULL, HPX_NULL, HPX_NULL);
+        return HPX_NULL;
+    }
+    hpx_addr_t gate = hpx_lco_and_new(n);
+    _hpx_call(HPX_HERE, _pyhpx_chain, HPX_NULL, 2, &gate, &sync);
+    return gate;
+}
+
+// Report the failure `rtv` of a batch through its `gate` from `_pyhpx_gather`.
+// The operations which were not issued never signal the gate, so waiters are
+// released by the error instead.
+static int _pyhpx_gather_error(hpx_addr_t gate, int rtv)
+{
+    if(gate != HPX_NULL) {
+        hpx_lco_error(gate, rtv, HPX_NULL);
+    }
+    return rtv;
+}
+
+static int _pyhpx_rank_handler(void)
+{
+    int rank = hpx_get_my_rank();
+    return _hpx_thread_continue(2, &rank, sizeof(rank));
+}
+static HPX_ACTION(HPX_DEFAULT, 0, _pyhpx_rank, _pyhpx_rank_handler);
+
+void pyhpx_addr_add_n(const hpx_addr_t *addrs, const int64_t *bytes, hpx_addr_t *out,
+                      size_t n, uint32_t bsize)
+{
+    for(size_t i = 0; i < n; ++i) {
+        out[i] = hpx_addr_add(addrs[i], bytes[i], bsize);
+    }
+}
+
+int pyhpx_addr_owner_n(const hpx_addr_t *addrs, int *ranks, size_t n)
+{
+    hpx_addr_t *futures = malloc(n * sizeof(hpx_addr_t));
+    if(futures == NULL) {
+        return HPX_ENOMEM;
+    }
+    int rtv = HPX_SUCCESS;
+    size_t issued = 0;
+    for(; issued < n; ++issued) {
+        futures[issued] = hpx_lco_future_new(sizeof(int));
+        rtv = _hpx_call(addrs[issued], _pyhpx_rank, futures[issued], 0);
+        if(rtv != HPX_SUCCESS) {
+            hpx_lco_delete_sync(futures[issued]);
+            break;
+        }
+    }
+    for(size_t i = 0; i < issued; ++i) {
+        hpx_lco_get(futures[i], sizeof(int), &ranks[i]);
+        hpx_lco_delete_sync(futures[i]);
+    }
+    free(futures);
+    return rtv;
+}
+
+int pyhpx_call_n(const hpx_addr_t *addrs, size_t n, hpx_action_t action, hpx_addr_t rsync,
+                 const void *args, size_t size)
+{
+    for(size_t i = 0; i < n; ++i) {
+        int rtv = _hpx_call(addrs[i], action, rsync, 2, args, size);
+        if(rtv != HPX_SUCCESS) {
+            return _pyhpx_gather_error(rsync, rtv);
+        }
+    }
+    return HPX_SUCCESS;
+}
+
+int pyhpx_gas_memget_v(void *to, const hpx_addr_t *from, const size_t *sizes, size_t n,
+                       hpx_addr_t lsync)
+{
+    hpx_addr_t gate = _pyhpx_gather(n, lsync);
+    char *buffer = to;
+    for(size_t i = 0; i < n; ++i) {
+        int rtv = hpx_gas_memget(buffer, from[i], sizes[i], gate);
+        if(rtv != HPX_SUCCESS) {
+            return _pyhpx_gather_error(gate, rtv);
+        }
+        buffer += sizes[i];
+    }
+    return HPX_SUCCESS;
+}
+
+int pyhpx_gas_memput_v(const hpx_addr_t *to, const void *from, const size_t *sizes, size_t n,
+                       hpx_addr_t lsync, hpx_addr_t rsync)
+{
+    hpx_addr_t lgate = _pyhpx_gather(n, lsync);
+    hpx_addr_t rgate = _pyhpx_gather(n, rsync);
+    const char *buffer = from;
+    for(size_t i = 0; i < n; ++i) {
+        int rtv = hpx_gas_memput(to[i], buffer, sizes[i], lgate, rgate);
+        if(rtv != HPX_SUCCESS) {
+            _pyhpx_gather_error(lgate, rtv);
+            return _pyhpx_gather_error(rgate, rtv);
+        }
+        buffer += sizes[i];
+    }
+    return HPX_SUCCESS;
+}
+
+int pyhpx_gas_memcpy_v(const hpx_addr_t *to, const hpx_addr_t *from, size_t size, size_t n,
+                       hpx_addr_t sync)
+{
+    hpx_addr_t gate = _pyhpx_gather(n, sync);
+    for(size_t i = 0; i < n; ++i) {
+        int rtv = hpx_gas_memcpy(to[i], from[i], size, gate);
+        if(rtv != HPX_SUCCESS) {
+            return _pyhpx_gather_error(gate, rtv);
+        }
+    }
+    return HPX_SUCCESS;
+}
+
+void pyhpx_gas_unpin_n(const hpx_addr_t *addrs, size_t n)
+{
+    for(size_t i = 0; i < n; ++i) {
+        hpx_gas_unpin(addrs[i]);
+    }
+}
+
+#define PYHPX_ATOMIC_SUM 0
+#define PYHPX_ATOMIC_MIN 1
+#define PYHPX_ATOMIC_MAX 2
+#define PYHPX_ATOMIC_INT64 0
+#define PYHPX_ATOMIC_DOUBLE 1
+
+// Atomically combine `value` (the bits of an int64_t or a double) into the
+// 8 bytes at `target` and return the previous bits.
+static uint64_t _pyhpx_atomic_op(uint64_t *target, int op, int type, uint64_t value)
+{
+    uint64_t old = __atomic_load_n(target, __ATOMIC_RELAXED);
+    for(;;) {
+        uint64_t new_bits;
+        if(type == PYHPX_ATOMIC_DOUBLE) {
+            double lhs, rhs, result;
+            memcpy(&lhs, &old, sizeof(double));
+            memcpy(&rhs, &value, sizeof(double));
+            if(op == PYHPX_ATOMIC_SUM) {
+                result = lhs + rhs;
+            } else if(op == PYHPX_ATOMIC_MIN) {
+                result = rhs < lhs ? rhs : lhs;
+            } else {
+                result = rhs > lhs ? rhs : lhs;
+            }
+            memcpy(&new_bits, &result, sizeof(double));
+        } else {
+            int64_t lhs = (int64_t) old, rhs = (int64_t) value, result;
+            if(op == PYHPX_ATOMIC_SUM) {
+                result = lhs + rhs;
+            } else if(op == PYHPX_ATOMIC_MIN) {
+                result = rhs < lhs ? rhs : lhs;
+            } else {
+                result = rhs > lhs ? rhs : lhs;
+            }
+            new_bits = (uint64_t) result;
+        }
+        if(__atomic_compare_exchange_n(target, &old, new_bits, 0, __ATOMIC_ACQ_REL,
+                                       __ATOMIC_RELAXED)) {
+            return old;
+        }
+    }
+}
+
+static int _pyhpx_fetch_op_handler(uint64_t *target, int op, int type, uint64_t value)
+{
+    uint64_t old = _pyhpx_atomic_op(target, op, type, value);
+    return _hpx_thread_continue(2, &old, sizeof(old));
+}
+static HPX_ACTION(HPX_DEFAULT, HPX_PINNED, _pyhpx_fetch_op, _pyhpx_fetch_op_handler,
+                  HPX_POINTER, HPX_INT, HPX_INT, HPX_UINT64);
+
+static int _pyhpx_cas_handler(int64_t *target, int64_t expected, int64_t desired)
+{
+    // on failure `expected` is updated to the current value
+    __atomic_compare_exchange_n(target, &expected, desired, 0, __ATOMIC_ACQ_REL,
+                                __ATOMIC_RELAXED);
+    return _hpx_thread_continue(2, &expected, sizeof(expected));
+}
+static HPX_ACTION(HPX_DEFAULT, HPX_PINNED, _pyhpx_cas, _pyhpx_cas_handler,
+                  HPX_POINTER, HPX_SINT64, HPX_SINT64);
+
+typedef struct {
+    int op;
+    int type;
+    uint64_t values[];
+} _pyhpx_accumulate_args_t;
+
+static int _pyhpx_accumulate_handler(uint64_t *target, _pyhpx_accumulate_args_t *args,
+                                     size_t size)
+{
+    size_t n = (size - sizeof(_pyhpx_accumulate_args_t)) / sizeof(uint64_t);
+    for(size_t i = 0; i < n; ++i) {
+        _pyhpx_atomic_op(&target[i], args->op, args->type, args->values[i]);
+    }
+    return HPX_SUCCESS;
+}
+static HPX_ACTION(HPX_DEFAULT, HPX_PINNED | HPX_MARSHALLED, _pyhpx_accumulate,
+                  _pyhpx_accumulate_handler, HPX_POINTER, HPX_POINTER, HPX_SIZE_T);
+
+int pyhpx_atomic_fetch_op_n(const hpx_addr_t *addrs, int op, int type, const uint64_t *values,
+                            uint64_t *old, size_t n)
+{
+    hpx_addr_t *futures = malloc(n * sizeof(hpx_addr_t));
+    if(futures == NULL) {
+        return HPX_ENOMEM;
+    }
+    int rtv = HPX_SUCCESS;
+    size_t issued = 0;
+    for(; issued < n; ++issued) {
+        futures[issued] = hpx_lco_future_new(sizeof(uint64_t));
+        rtv = _hpx_call(addrs[issued], _pyhpx_fetch_op, futures[issued], 3, &op, &type,
+                        &values[issued]);
+        if(rtv != HPX_SUCCESS) {
+            hpx_lco_delete_sync(futures[issued]);
+            break;
+        }
+    }
+    for(size_t i = 0; i < issued; ++i) {
+        hpx_lco_get(futures[i], sizeof(uint64_t), &old[i]);
+        hpx_lco_delete_sync(futures[i]);
+    }
+    free(futures);
+    return rtv;
+}
+
+int pyhpx_atomic_cas_n(const hpx_addr_t *addrs, const int64_t *expected,
+                       const int64_t *desired, int64_t *old, size_t n)
+{
+    hpx_addr_t *futures = malloc(n * sizeof(hpx_addr_t));
+    if(futures == NULL) {
+        return HPX_ENOMEM;
+    }
+    int rtv = HPX_SUCCESS;
+    size_t issued = 0;
+    for(; issued < n; ++issued) {
+        futures[issued] = hpx_lco_future_new(sizeof(int64_t));
+        rtv = _hpx_call(addrs[issued], _pyhpx_cas, futures[issued], 2, &expected[issued],
+                        &desired[issued]);
+        if(rtv != HPX_SUCCESS) {
+            hpx_lco_delete_sync(futures[issued]);
+            break;
+        }
+    }
+    for(size_t i = 0; i < issued; ++i) {
+        hpx_lco_get(futures[i], sizeof(int64_t), &old[i]);
+        hpx_lco_delete_sync(futures[i]);
+    }
+    free(futures);
+    return rtv;
+}
+
+int pyhpx_atomic_accumulate_n(const hpx_addr_t *addrs, int op, int type, const void *values,
+                              size_t count, size_t n, hpx_addr_t lsync, hpx_addr_t rsync)
+{
+    size_t size = sizeof(_pyhpx_accumulate_args_t) + count * sizeof(uint64_t);
+    _pyhpx_accumulate_args_t *args = malloc(size);
+    if(args == NULL) {
+        return HPX_ENOMEM;
+    }
+    args->op = op;
+    args->type = type;
+    hpx_addr_t gate = _pyhpx_gather(n, rsync);
+    const char *buffer = values;
+    int rtv = HPX_SUCCESS;
+    for(size_t i = 0; i < n && rtv == HPX_SUCCESS; ++i) {
+        memcpy(args->values, buffer + i * count * sizeof(uint64_t), count * sizeof(uint64_t));
+        rtv = _hpx_call(addrs[i], _pyhpx_accumulate, gate, 2, args, size);
+    }
+    free(args);
+    if(rtv != HPX_SUCCESS) {
+        _pyhpx_gather_error(gate, rtv);
+    }
+    // the values are copied into the parcels, so they can be reused at once
+    if(lsync != HPX_NULL) {
+        hpx_lco_set(lsync, 0, NULL, HPX_NULL, HPX_NULL);
+    }
+    return rtv;
+}
+
 int hpx_custom_init(int *argc, char ***argv)
 {
     libhpx_register_begin_callback((CallbackType) begin_callback);
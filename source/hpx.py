@@ -7,7 +7,13 @@ from abc import ABCMeta, abstractmethod
 from collections import deque
 import pickle
 import logging
-import copy
+import threading
+import functools
+import itertools
+import random
+import zlib
+import json
+from contextlib import contextmanager, ExitStack
 
 # {{{ Define HPX status
 
@@ -26,6 +32,8 @@ USER = lib.HPX_USER
 # {{{ Define argument types
 class Type:
     CHAR = lib.HPX_CHAR_lvalue
+    UCHAR = lib.HPX_UCHAR_lvalue
+    SCHAR = lib.HPX_SCHAR_lvalue
     SHORT = lib.HPX_SHORT_lvalue
     USHORT = lib.HPX_USHORT_lvalue
     SSHORT = lib.HPX_SSHORT_lvalue
@@ -61,14 +69,28 @@ class Type:
 
 _c_def_map = {
     Type.CHAR: "char",
+    Type.UCHAR: "unsigned char",
+    Type.SCHAR: "signed char",
     Type.SHORT: "short",
     Type.USHORT: "unsigned short",
     Type.SSHORT: "signed short",
     Type.INT: "int", 
     Type.UINT: "unsigned int",
     Type.SINT: "signed int",
+    Type.LONG: "long",
+    Type.ULONG: "unsigned long",
+    Type.SLONG: "signed long",
+    Type.UINT8: "uint8_t",
+    Type.SINT8: "int8_t",
+    Type.UINT16: "uint16_t",
+    Type.SINT16: "int16_t",
+    Type.UINT32: "uint32_t",
+    Type.SINT32: "int32_t",
+    Type.UINT64: "uint64_t",
+    Type.SINT64: "int64_t",
     Type.FLOAT: "float",
     Type.DOUBLE: "double",
+    Type.LONGDOUBLE: "long double",
     Type.POINTER: "void*",
     Type.SIZE_T: "size_t",
     Type.ADDR: "hpx_addr_t",
@@ -87,14 +109,29 @@ ATTR_NONE = lib.HPX_ATTR_NONE
 MARSHALLED = lib.HPX_MARSHALLED
 # Action automatically pins memory.
 PINNED = lib.HPX_PINNED
+# Action parcels to the same locality are coalesced by the network.
+COALESCED = lib.HPX_COALESCED
+# Action parcels are compressed before sending.
+COMPRESSED = lib.HPX_COMPRESSED
+# Action takes a vector of marshalled buffers.
+VECTORED = lib.HPX_VECTORED
 
 # }}}
 
+# all actions created in this process, keyed by their keys
+_action_registry = {}
+
+def _get_action(key):
+    """ Get the action registered with `key`. This is used for unpickling actions.
+    """
+    return _action_registry[key]
+
 class BaseAction(metaclass=ABCMeta):
 
     @abstractmethod
     def __init__(self, python_func, action_type, key, marshalled, pinned, 
-                 argument_types, array_type):
+                 argument_types, array_type, coalesced=False, compressed=False,
+                 vectored=False):
         """Register an HPX action.
         
         Note:
@@ -107,6 +144,10 @@ class BaseAction(metaclass=ABCMeta):
             argument_types: A Python list of argument types.
             marshalled (string): Can be 'true', 'false', or 'continuous'
             array_type: Type of the numpy array if marshalled is 'continuous'
+            coalesced (bool): Whether parcels of this action are coalesced.
+            compressed (bool): Whether parcels of this action are compressed.
+            vectored (bool): Whether the numpy array arguments of this marshalled 
+                action are sent as separate buffers.
         """
         self.id = ffi.new("hpx_action_t *")
         
@@ -116,70 +157,150 @@ class BaseAction(metaclass=ABCMeta):
                   .encode('ascii'))
         self.key = key
 
+        if vectored and marshalled != 'true':
+            raise ValueError("vectored action must be a marshalled action")
+
         self.marshalled = marshalled
         self.pinned = pinned
-
-        if marshalled == 'true':
+        self.vectored = vectored
+        self._python_func = python_func
+        _action_registry[key] = self
+
+        # network attributes are orthogonal to the argument passing mode
+        attr = ATTR_NONE
+        if coalesced:
+            attr |= COALESCED
+        if compressed:
+            attr |= COMPRESSED
+
+        if vectored:
+            def callback_func(n, pointers, sizes):
+                target, layout = pickle.loads(ffi.buffer(pointers[0], sizes[0])[:])
+                arrays = []
+                for i in range(1, n):
+                    dtype, shape = layout[i-1]
+                    arrays.append(np.frombuffer(ffi.buffer(pointers[i], sizes[i]), 
+                                                dtype=dtype).reshape(shape))
+                if pinned:
+                    try:
+                        rtv = python_func(target.try_pin(), arrays)
+                    finally:
+                        target.unpin()
+                else:
+                    rtv = python_func(arrays)
+                return rtv
+            self._ffi_func = ffi.callback("int (int, void **, size_t *)")(callback_func)
+            rtv = lib.hpx_register_action(action_type, MARSHALLED | VECTORED | attr, key,
+                                    self.id, 4, self._ffi_func, 
+                                    Type.INT, Type.POINTER, Type.POINTER)
+        elif marshalled == 'true':
             def callback_func(pointer, size):
                 args_bytes = ffi.buffer(pointer, size)[:]
                 args = pickle.loads(args_bytes)
-                if pinned:
-                    argslist = list(args)
-                    target = argslist[0]
-                    argslist[0] = target.try_pin()
-                    args = tuple(argslist)
-                rtv = python_func(*args)
-                if pinned:
-                    target = target.unpin()
+                if not pinned:
+                    return python_func(*args)
+                target = args[0]
+                local = target.try_pin()
+                try:
+                    rtv = python_func(local, *args[1:])
+                finally:
+                    target.unpin()
                 return rtv
             self._ffi_func = ffi.callback("int (void*, size_t)")(callback_func)
-            rtv = lib.hpx_register_action(action_type, lib.HPX_MARSHALLED, key, 
+            rtv = lib.hpx_register_action(action_type, MARSHALLED | attr, key, 
                                     self.id, 3, self._ffi_func, 
                                     Type.POINTER, Type.SIZE_T)
+        elif marshalled == 'continuous' and pinned:
+            # the target block travels in a small header buffer next to the array
+            def callback_func(n, pointers, sizes):
+                target, layout = pickle.loads(ffi.buffer(pointers[0], sizes[0])[:])
+                array_arg = np.frombuffer(ffi.buffer(pointers[1], sizes[1]), dtype=array_type)
+                try:
+                    rtv = python_func(target.try_pin(), array_arg)
+                finally:
+                    target.unpin()
+                return rtv
+            self._ffi_func = ffi.callback("int (int, void **, size_t *)")(callback_func)
+            rtv = lib.hpx_register_action(action_type, MARSHALLED | VECTORED | attr, key,
+                                    self.id, 4, self._ffi_func, 
+                                    Type.INT, Type.POINTER, Type.POINTER)
         elif marshalled == 'continuous':
             def callback_func(pointer, size):
                 array_arg = np.frombuffer(ffi.buffer(pointer, size), dtype=array_type)
-                # support pinned and continuous??
                 rtv = python_func(array_arg)
                 return rtv
             self._ffi_func = ffi.callback("int (void*, size_t)")(callback_func)
-            rtv = lib.hpx_register_action(action_type, lib.HPX_MARSHALLED, key, self.id, 3, 
+            rtv = lib.hpx_register_action(action_type, MARSHALLED | attr, key, self.id, 3, 
                                     self._ffi_func, Type.POINTER, Type.SIZE_T)
         else:
             self._arguments_cdef = []
-            for argument in argument_types:
+            hpx_types = []
+            lco_arguments = []
+            longdouble_arguments = []
+            for i, argument in enumerate(argument_types):
                 if isinstance(argument, tuple):
                     if argument[0] != Type.LCO:
                         raise TypeError("The first entry in a tuple argument should be Type.LCO")
                     elif argument[1] is not None and not isinstance(argument[1], tuple):
                         raise TypeError("The second entry in a tuple argument should be None or a tuple")
-                    else:
-                        pass
-                        # TODO: implement support LCO type
-                else:
-                    self._arguments_cdef.append(_c_def_map[argument])
+                    lco_arguments.append((i, argument[1]))
+                    argument = Type.LCO
+                elif argument not in _c_def_map:
+                    raise TypeError("Unsupported argument type in position " + str(i))
+                elif argument == Type.LONGDOUBLE:
+                    longdouble_arguments.append(i)
+                self._arguments_cdef.append(_c_def_map[argument])
+                hpx_types.append(argument)
+            self._arguments_layout = _calculate_arguments_layout(self._arguments_cdef)
+            self._arguments_buffers = {}
+
+            # LCO arguments arrive as addresses and are wrapped for the Python function,
+            # long double arguments arrive as cdata and are converted like other floats
+            if len(lco_arguments) > 0 or len(longdouble_arguments) > 0:
+                def callback_func(*args):
+                    args = list(args)
+                    for i in longdouble_arguments:
+                        args[i] = float(args[i])
+                    for i, lco_spec in lco_arguments:
+                        if lco_spec is None:
+                            args[i] = _wrap_lco(args[i])
+                        else:
+                            args[i] = _wrap_lco(args[i], *lco_spec)
+                    return python_func(*args)
+            else:
+                callback_func = python_func
             
             if action_type == lib.HPX_FUNCTION:
-                self._ffi_func = ffi.callback("void(" + ",".join(self._arguments_cdef) + ")")(python_func)
+                self._ffi_func = ffi.callback("void(" + ",".join(self._arguments_cdef) + ")")(callback_func)
             else:
-                self._ffi_func = ffi.callback("int(" + ",".join(self._arguments_cdef) + ")")(python_func)
+                self._ffi_func = ffi.callback("int(" + ",".join(self._arguments_cdef) + ")")(callback_func)
             
-            rtv = lib.hpx_register_action(action_type, lib.HPX_ATTR_NONE, key,
-                                    self.id, len(argument_types) + 1, 
-                                    self._ffi_func, *argument_types)
+            rtv = lib.hpx_register_action(action_type, attr, key,
+                                    self.id, len(hpx_types) + 1, 
+                                    self._ffi_func, *hpx_types)
 
         if rtv != SUCCESS:
             raise HPXError("action registration error")
 
-    # Helper function for generating C arguments for this action
+    # Helper function for generating C arguments for this action. The arguments 
+    # are packed into a buffer preallocated once per scheduler thread. This is 
+    # safe because HPX copies the arguments into the parcel before a launch 
+    # returns or blocks.
     def _generate_c_arguments(self, args):
-        c_args = []
-        for i in range(len(self._arguments_cdef)):
-            c_type = self._arguments_cdef[i] + ' *'
+        if len(args) != len(self._arguments_cdef):
+            raise TypeError("expect {0} arguments, got {1}".format(
+                            len(self._arguments_cdef), len(args)))
+        thread_id = lib.hpx_get_my_thread_id()
+        arguments_buffer = self._arguments_buffers.get(thread_id)
+        if arguments_buffer is None:
+            arguments_buffer = _allocate_arguments_buffer(self._arguments_layout)
+            self._arguments_buffers[thread_id] = arguments_buffer
+        c_args = arguments_buffer[1]
+        for i in range(len(args)):
             if self._arguments_cdef[i] == 'hpx_addr_t':
-                c_args.append(ffi.new('hpx_addr_t *', args[i].addr))
+                c_args[i][0] = BaseAction._get_addr_int(args[i])
             else:
-                c_args.append(ffi.new(c_type, args[i]))
+                c_args[i][0] = args[i]
         return c_args
 
     # Helper function for generating marshalled arguments
@@ -194,12 +315,96 @@ class BaseAction(metaclass=ABCMeta):
         return pointer, size
 
     # Helper function for generating array arguments
-    def _generate_array_arguments(self, args):
-        if self.pinned:
-            raise RuntimeError("Pinned action is not supported for array argument")
+    def _generate_array_arguments(self, target_addr, args):
         pointer = ffi.cast("void *", args[0].__array_interface__['data'][0])
         size = ffi.cast("size_t", args[0].nbytes)
-        return pointer, size
+        if self.pinned:
+            if not isinstance(target_addr, GlobalAddressBlock):
+                raise TypeError("target_addr is not GlobalAddressBlock object")
+            header_pointer, header_size = _parse_marshalled_args((target_addr, None))
+            return [header_pointer, header_size, pointer, size]
+        return [pointer, size]
+
+    # Helper function for generating the buffer list of a vectored action. The 
+    # first buffer describes the layout of the numpy arrays in the remaining ones.
+    def _generate_vectored_arguments(self, target_addr, args):
+        if self.pinned:
+            if not isinstance(target_addr, GlobalAddressBlock):
+                raise TypeError("target_addr is not GlobalAddressBlock object")
+        else:
+            target_addr = None
+        layout = []
+        for array in args:
+            if not array.flags['C_CONTIGUOUS']:
+                raise RuntimeError("array arguments of a vectored action must be C contiguous")
+            layout.append((array.dtype, array.shape))
+        pointer, size = _parse_marshalled_args((target_addr, layout))
+        c_args = [pointer, size]
+        for array in args:
+            c_args.append(ffi.cast("void *", array.__array_interface__['data'][0]))
+            c_args.append(ffi.cast("size_t", array.nbytes))
+        return c_args
+
+    def __reduce__(self):
+        # actions are registered under the same key on every locality, so they are
+        # pickled by key and can be passed as marshalled arguments
+        return (_get_action, (self.key,))
+
+    def broadcast(self, *args, ranks=None, topology='tree', sync='rsync', rsync_lco=None):
+        """ Launch this action on a set of localities.
+
+        The arguments are pickled once. With the 'tree' topology, the payload is 
+        forwarded along a binomial tree over `ranks`, so the caller sends only 
+        log(P) parcels and the latency grows as log(P). With the 'flat' topology, 
+        the caller sends the payload to every rank directly. On each rank, this 
+        action is launched locally through its normal call path after the payload
+        has been forwarded further down the tree.
+
+        Args:
+            *args: The arguments of this action.
+            ranks (list): The ranks of the localities to reach, all localities if 
+                None. Duplicate ranks are reached once.
+            topology (string): 'tree' or 'flat'.
+            sync (string): 'rsync' waits until the action has completed on all ranks.
+                'lsync' returns once the payload is sent, in which case `rsync_lco`
+                is set once by every rank.
+            rsync_lco (LCO): An optional LCO for 'lsync'.
+        """
+        if self.marshalled != 'true' or self.pinned or self.vectored:
+            raise RuntimeError("only non-pinned marshalled actions support hpx.Action.broadcast")
+        if topology not in ('tree', 'flat'):
+            raise ValueError("'topology' argument can only be 'tree' or 'flat'")
+        if sync not in ('rsync', 'lsync'):
+            raise ValueError("'sync' argument can only be 'rsync' or 'lsync'")
+        if ranks is None:
+            ranks = range(get_num_ranks())
+        # a rank listed twice runs the action once
+        ranks = sorted(set(int(rank) for rank in ranks))
+        if len(ranks) == 0:
+            return
+
+        payload = pickle.dumps(args)
+        if sync == 'rsync':
+            rsync_lco = And(len(ranks))
+        if topology == 'tree':
+            _broadcast_forward(THERE(ranks[0]), self, payload, ranks, rsync_lco)
+        else:
+            for rank in ranks:
+                _broadcast_forward(THERE(rank), self, payload, [rank], rsync_lco)
+        if sync == 'rsync':
+            rsync_lco.wait()
+            rsync_lco.delete()
+
+    # Helper function for generating the variadic arguments of a launch
+    def _generate_arguments(self, target_addr, args):
+        if self.vectored:
+            return self._generate_vectored_arguments(target_addr, args)
+        elif self.marshalled == 'true':
+            return list(self._generate_marshalled_arguments(target_addr, args))
+        elif self.marshalled == 'continuous':
+            return self._generate_array_arguments(target_addr, args)
+        else:
+            return self._generate_c_arguments(args)
 
     # Helper function for getting target address of type int
     def _get_addr_int(target_addr):
@@ -211,6 +416,8 @@ class BaseAction(metaclass=ABCMeta):
             target_addr_int = target_addr
         elif isinstance(target_addr, np.integer):
             target_addr_int = np.asscalar(target_addr)
+        elif isinstance(target_addr, LCO):
+            target_addr_int = target_addr.addr
         else:
             raise TypeError("target_addr must be GlobalAddressBlock, GlobalAddress or int")
         return target_addr_int        
@@ -221,10 +428,12 @@ class BaseAction(metaclass=ABCMeta):
         Args:
             target_addr (Union[hpx.GlobalAddressBlock, hpx.GlobalAddress, int]): Specify the 
                 location where this action is launched. If this action is a pinned 
-                action, this argument must be a GlobalAddressBlock object. Otherwise, 
-                this argument can be either GlobalAddressBlock or GlobalAddress. You can 
-                launch this action on every locality of this process by specifing this 
-                argument to hpx.NULL().
+                action, this argument must be a GlobalAddressBlock object, or a 
+                GlobalMemory object to launch this action on every block of it. 
+                Otherwise, this argument can be either GlobalAddressBlock or 
+                GlobalAddress, or an AddressArray to launch this action on every 
+                address of it. You can launch this action on every locality of this 
+                process by specifing this argument to hpx.NULL().
             sync (string): This argument can be either 'async', lsync' or 'rsync'. If 
                 this argument is 'rsync', this is a completely synchronized call meaning
                 this function call will be blocked until the action is completed. If 
@@ -237,7 +446,9 @@ class BaseAction(metaclass=ABCMeta):
                 reused or changed. This is only meaningful when `sync` argument is 
                 'async'. 
             rsync_lco (hpx.LCO): An LCO object ot trigger when the action is completed.
-                This is only meaningful when `sync` arugument is `async` or `lsync`.
+                This is only meaningful when `sync` arugument is `async` or `lsync`. If 
+                `target_addr` is a GlobalMemory or AddressArray object, this LCO is 
+                triggered once for every block or address.
             out_array (numpy.ndarray): An numpy array to be filled with the return value
                 of the action. This argument is only meaningful when `sync` argument is 
                 'rsync'. If you do not care about the return value, you can specify this
@@ -245,12 +456,32 @@ class BaseAction(metaclass=ABCMeta):
         """
         logging.debug("rank {0} on thread {1} calling action {2}".format(get_my_rank(), get_my_thread_id(), self.key))
 
-        if self.marshalled == 'true':
-            pointer, size = self._generate_marshalled_arguments(target_addr, args)
-        elif self.marshalled == 'continuous':
-            pointer, size = self._generate_array_arguments(args)
-        else:
-            c_args = self._generate_c_arguments(*args)
+        # launch on every address of an AddressArray
+        if isinstance(target_addr, AddressArray):
+            if out_array is not None:
+                raise RuntimeError("out_array is not supported when launching on an AddressArray")
+            self._call_address_array(target_addr, args, sync, gate, lsync_lco, rsync_lco)
+            return
+
+        # broadcast pinned action over the blocks of a GlobalMemory
+        if isinstance(target_addr, GlobalMemory):
+            if not self.pinned:
+                raise TypeError("Only pinned action can be launched on a GlobalMemory object")
+            if out_array is not None:
+                raise RuntimeError("out_array is not supported when launching on a GlobalMemory")
+            if sync == 'rsync':
+                and_lco = And(_calculate_block_size(target_addr.numBlock))
+                for block in target_addr.blocks():
+                    self(block, *args, sync='lsync', gate=gate, rsync_lco=and_lco)
+                and_lco.wait()
+                and_lco.delete()
+            else:
+                for block in target_addr.blocks():
+                    self(block, *args, sync=sync, gate=gate, lsync_lco=lsync_lco, 
+                         rsync_lco=rsync_lco)
+            return
+
+        c_args = self._generate_arguments(target_addr, args)
 
         lsync_addr = _get_lco_addr(lsync_lco)
         rsync_addr = _get_lco_addr(rsync_lco)
@@ -258,33 +489,20 @@ class BaseAction(metaclass=ABCMeta):
         # broadcast action 
         if (isinstance(target_addr, GlobalAddress) and target_addr.addr == lib.HPX_NULL):
             if self.pinned:
-                raise RuntimeError("Pinned action is not supported for broadcast.")
+                raise RuntimeError("Pinned action can only be broadcast over the blocks "
+                                   "of a GlobalMemory object.")
             if sync == 'lsync':
-                if self.marshalled == 'true' or self.marshalled == 'continous':
-                    rtv = lib._hpx_process_broadcast_lsync(
-                            lib.hpx_thread_current_pid(), self.id[0], 
-                            rsync_addr, 2, pointer, size)
-                else:
-                    rtv = lib._hpx_process_broadcast_lsync(
-                            lib.hpx_thread_current_pid(), self.id[0],
-                            rsync_addr, len(c_args), *c_args)
+                rtv = lib._hpx_process_broadcast_lsync(
+                        lib.hpx_thread_current_pid(), self.id[0],
+                        rsync_addr, len(c_args), *c_args)
             elif sync == 'rsync':
-                if self.marshalled == 'true' or self.marshalled == 'continuous':
-                    rtv = lib._hpx_process_broadcast_rsync(
-                            lib.hpx_thread_current_pid(), self.id[0],
-                            2, pointer, size)
-                else:
-                    rtv = lib._hpx_process_broadcast_rsync(
-                            lib.hpx_thread_current_pid(), self.id[0],
-                            len(c_args), *c_args)
-            elif sync == 'async':
-                if self.marshalled == 'true' or self.marshalled == 'continuous':
-                    rtv = lib._hpx_process_broadcast(lib.hpx_thread_current_pid(),
-                        self.id[0], lsync_addr, rsync_addr, 2, pointer, size)
-                else:
-                    rtv = lib._hpx_process_broadcast(lib.hpx_thread_current_pid(),
-                        self.id[0], lsync_addr, rsync_addr,
+                rtv = lib._hpx_process_broadcast_rsync(
+                        lib.hpx_thread_current_pid(), self.id[0],
                         len(c_args), *c_args)
+            elif sync == 'async':
+                rtv = lib._hpx_process_broadcast(lib.hpx_thread_current_pid(),
+                    self.id[0], lsync_addr, rsync_addr,
+                    len(c_args), *c_args)
             elif isinstance(sync, str):
                 raise NameError("unrecognized string for sync argument")
             else:
@@ -299,10 +517,7 @@ class BaseAction(metaclass=ABCMeta):
 
         if gate is None:
             if sync == 'lsync':
-                if self.marshalled == 'true' or self.marshalled == 'continuous':
-                    rtv = lib._hpx_call(target_addr_int, self.id[0], rsync_addr, 2, pointer, size)
-                else:
-                    rtv = lib._hpx_call(target_addr_int, self.id[0], rsync_addr, len(c_args), *c_args)
+                rtv = lib._hpx_call(target_addr_int, self.id[0], rsync_addr, len(c_args), *c_args)
             elif sync == 'rsync':
                 if out_array is not None:
                     out_array_byte = out_array.nbytes
@@ -310,18 +525,11 @@ class BaseAction(metaclass=ABCMeta):
                 else:
                     out_array_byte = 0
                     out_array_pointer = ffi.NULL
-                if self.marshalled == 'true' or self.marshalled == 'continuous':
-                    rtv = lib._hpx_call_sync(target_addr_int, self.id[0], out_array_pointer, 
-                        out_array_byte, 2, pointer, size)
-                else:
-                    rtv = lib._hpx_call_sync(target_addr_int, self.id[0], out_array_pointer, 
-                        out_array_byte, len(c_args), *c_args)
+                rtv = lib._hpx_call_sync(target_addr_int, self.id[0], out_array_pointer, 
+                    out_array_byte, len(c_args), *c_args)
             elif sync == 'async':
-                if self.marshalled == 'true' or self.marshalled == 'continuous':
-                    rtv = lib._hpx_call_async(target_addr_int, self.id[0], lsync_addr, rsync_addr, 2, pointer, size)
-                else:
-                    rtv = lib._hpx_call_async(target_addr_int, self.id[0], lsync_addr, rsync_addr, len(c_args), 
-                        *c_args)
+                rtv = lib._hpx_call_async(target_addr_int, self.id[0], lsync_addr, rsync_addr, len(c_args), 
+                    *c_args)
             elif isinstance(sync, str):
                 raise ValueError("sync argument not recognizable")
             else:
@@ -329,10 +537,7 @@ class BaseAction(metaclass=ABCMeta):
         elif isinstance(gate, LCO):            
             gate_int = gate.addr
             if sync == 'lsync':
-                if self.marshalled == 'true' or self.marshalled == 'continuous':
-                    rtv = lib._hpx_call_when(gate_int, target_addr_int, self.id[0], rsync_addr, 2, pointer, size)
-                else:
-                    rtv = lib._hpx_call_when(gate_int, target_addr_int, self.id[0], rsync_addr, len(c_args), *c_args)
+                rtv = lib._hpx_call_when(gate_int, target_addr_int, self.id[0], rsync_addr, len(c_args), *c_args)
             elif sync == 'rsync':
                 if out_array is not None:
                     out_array_byte = out_array.nbytes
@@ -340,12 +545,8 @@ class BaseAction(metaclass=ABCMeta):
                 else:
                     out_array_byte = 0
                     out_array_pointer = ffi.NULL
-                if self.marshalled == 'true' or self.marshalled == 'continuous':
-                    rtv = lib._hpx_call_when_sync(gate_int, target_addr_int, self.id[0], out_array_pointer, 
-                        out_array_byte, 2, pointer, size)     
-                else:
-                    rtv = lib._hpx_call_when_sync(gate_int, target_addr_int, self.id[0], out_array_pointer,
-                        out_array_byte, len(c_args), *c_args)
+                rtv = lib._hpx_call_when_sync(gate_int, target_addr_int, self.id[0], out_array_pointer,
+                    out_array_byte, len(c_args), *c_args)
             elif sync == 'async':
                 raise RuntimeError("async not supported when gate is provided")
             else:
@@ -356,28 +557,38 @@ class BaseAction(metaclass=ABCMeta):
         if rtv != SUCCESS:
             raise HPXError("action launch failed")
 
+    # Helper function for launching this action on every address of an AddressArray
+    def _call_address_array(self, targets, args, sync, gate, lsync_lco, rsync_lco):
+        if self.pinned:
+            raise TypeError("Pinned action cannot be launched on an AddressArray")
+        if sync == 'rsync':
+            and_lco = And(len(targets))
+            self._call_address_array(targets, args, 'lsync', gate, None, and_lco)
+            and_lco.wait()
+            and_lco.delete()
+            return
+
+        if (sync == 'lsync' and gate is None and self.marshalled == 'true'
+                and not self.vectored):
+            # the marshalled arguments are shared by all launches
+            c_args = self._generate_arguments(None, args)
+            rtv = lib.pyhpx_call_n(_get_array_pointer(targets.addrs, "hpx_addr_t *"),
+                                   len(targets), self.id[0], _get_lco_addr(rsync_lco),
+                                   c_args[0], c_args[1])
+            if rtv != SUCCESS:
+                raise HPXError("action launch failed")
+        else:
+            for addr in targets.addrs:
+                self(int(addr), *args, sync=sync, gate=gate, lsync_lco=lsync_lco,
+                     rsync_lco=rsync_lco)
+
 def call_cc(action, target_addr, *args, gate=None):
     target_addr_int = BaseAction._get_addr_int(target_addr)
+    c_args = action._generate_arguments(target_addr, args)
     if gate is None:
-        if action.marshalled == 'true':
-            pointer, size = action._generate_marshalled_arguments(target_addr, args)
-            rtv = lib._hpx_call_cc(target_addr_int, action.id[0], 2, pointer, size)
-        elif action.marshalled == 'continuous':
-            pointer, size = action._generate_array_arguments(args)
-            rtv = lib._hpx_call_cc(target_addr_int, action.id[0], 2, pointer, size)
-        else:
-            c_args = action._generate_c_arguments(args)
-            rtv = lib._hpx_call_cc(target_addr_int, action.id[0], len(c_args), *c_args)
+        rtv = lib._hpx_call_cc(target_addr_int, action.id[0], len(c_args), *c_args)
     elif isinstance(gate, LCO):
-        if action.marshalled == 'true':
-            pointer, size = action._generate_marshalled_arguments(target_addr, args)
-            rtv = lib._hpx_call_when_cc(gate.addr, target_addr_int, action.id[0], 2, pointer, size)
-        elif action.marshalled == 'continuous':
-            pointer, size = action._generate_array_arguments(args)
-            rtv = lib._hpx_call_when_cc(gate.addr, target_addr_int, action.id[0], 2, pointer, size)
-        else:
-            c_args = action._generate_c_arguments(args)
-            rtv = lib._hpx_call_when_cc(gate.addr, target_addr_int, action.id[0], len(c_args), *c_args)
+        rtv = lib._hpx_call_when_cc(gate.addr, target_addr_int, action.id[0], len(c_args), *c_args)
     else:
         raise TypeError("Unrecognized gate argument")
 
@@ -387,44 +598,130 @@ def call_cc(action, target_addr, *args, gate=None):
 def call_with_continuation(target_action, target_addr, cont_action, cont_addr, *args, gate=None):
     target_addr_int = BaseAction._get_addr_int(target_addr)
     cont_addr_int = BaseAction._get_addr_int(cont_addr)
+    c_args = target_action._generate_arguments(target_addr, args)
 
     if gate is None:
-        if target_action.marshalled == 'true':
-            pointer, size = target_action._generate_marshalled_arguments(target_addr, args)
-            rtv = lib._hpx_call_with_continuation(target_addr_int, target_action.id[0], cont_addr_int, 
-                                                cont_action.id[0], 2, pointer, size)
-        elif target_action.marshalled == 'continuous':
-            pointer, size = target_action._generate_array_arguments(args)
-            rtv = lib._hpx_call_with_continuation(target_addr_int, target_action.id[0], cont_addr_int, 
-                                                cont_action.id[0], 2, pointer, size)
-        else:
-            c_args = target_action._generate_c_arguments(args)
-            rtv = lib._hpx_call_with_continuation(target_addr_int, target_action.id[0], cont_addr_int, 
-                                                cont_action.id[0], len(c_args), *c_args)
+        rtv = lib._hpx_call_with_continuation(target_addr_int, target_action.id[0], cont_addr_int, 
+                                            cont_action.id[0], len(c_args), *c_args)
     elif isinstance(gate, LCO):
-        if target_action.marshalled == 'true':
-            pointer, size = target_action._generate_marshalled_arguments(target_addr, args)
-            rtv = lib._hpx_call_when_with_continuation(gate.addr, target_addr_int, target_action.id[0], cont_addr_int,
-                                                cont_action.id[0], 2, pointer, size)
-        elif target_action.marshalled == 'continuous':
-            pointer, size = target_action._generate_array_arguments(args)
-            rtv = lib._hpx_call_when_with_continuation(gate.addr, target_addr_int, target_action.id[0], cont_addr_int,
-                                                cont_action.id[0], 2, pointer, size)
-        else:
-            c_args = target_action._generate_c_arguments(args)
-            rtv = lib._hpx_call_when_with_continuation(gate.addr, target_addr_int, target_action.id[0], cont_addr_int,
-                                                cont_action.id[0], len(c_args), *c_args)
+        rtv = lib._hpx_call_when_with_continuation(gate.addr, target_addr_int, target_action.id[0], cont_addr_int,
+                                            cont_action.id[0], len(c_args), *c_args)
     else:
         raise TypeError("Unrecognized gate argument")
 
+class _Coarsener:
+    """ Aggregates launches of a coarsened `Action` per target address.
+
+    Each buffered launch is pickled when it is issued, so the caller may reuse
+    the arguments right away. A full (or expired) buffer is shipped as a single
+    parcel to a companion batch action, which runs the calls in a loop on the
+    receiver. The age of a buffer is only checked when a launch is pushed; there
+    is no timer, so a partial buffer stays until the next push or `flush`.
+    """
+    def __init__(self, action, python_func, flush_size, flush_interval):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._batches = {}
+        self._started = {}
+        self._lock = threading.Lock()
+
+        def run_batch(calls):
+            # a failing call must not keep the callers of the later calls waiting,
+            # so every LCO is set and the first error is raised after the loop
+            error = None
+            for args_bytes, rsync_addr in calls:
+                try:
+                    python_func(*pickle.loads(args_bytes))
+                except Exception as e:
+                    if error is None:
+                        error = e
+                finally:
+                    if rsync_addr != lib.HPX_NULL:
+                        lib.hpx_lco_set(rsync_addr, 0, ffi.NULL, lib.HPX_NULL, lib.HPX_NULL)
+            if error is not None:
+                raise error
+            return SUCCESS
+        self._batch_action = Action(run_batch, key=action.key + b':coarsened')
+
+    def push(self, target_addr_int, args, rsync_addr):
+        call = (pickle.dumps(args), rsync_addr)
+        # only touch the buffers while holding the lock, the parcel is sent 
+        # after releasing it
+        with self._lock:
+            calls = self._batches.setdefault(target_addr_int, [])
+            if len(calls) == 0:
+                self._started[target_addr_int] = time_now()
+            calls.append(call)
+            if (len(calls) >= self.flush_size or 
+                time_elapsed_ms(self._started[target_addr_int]) >= self.flush_interval):
+                del self._batches[target_addr_int]
+            else:
+                calls = None
+        if calls is not None:
+            self._batch_action(target_addr_int, calls, sync='lsync')
+
+    def flush(self):
+        with self._lock:
+            batches = self._batches
+            self._batches = {}
+        for target_addr_int, calls in batches.items():
+            self._batch_action(target_addr_int, calls, sync='lsync')
+
 class Action(BaseAction):
     def __init__(self, python_func, key=None, marshalled='true', pinned=False, 
-                 argument_types=None, array_type=None):
-        return super(Action, self).__init__(python_func, lib.HPX_DEFAULT, key, 
-                                            marshalled, pinned, argument_types, array_type)
+                 argument_types=None, array_type=None, coarsen=False, flush_size=64,
+                 flush_interval=1.0, coalesced=False, compressed=False, vectored=False,
+                 pin_cache=False):
+        if pin_cache:
+            python_func = _with_pin_cache(python_func)
+        super(Action, self).__init__(python_func, lib.HPX_DEFAULT, key, 
+                                     marshalled, pinned, argument_types, array_type,
+                                     coalesced, compressed, vectored)
+        if coarsen:
+            if marshalled != 'true' or pinned or vectored:
+                raise ValueError("coarsening is only supported for non-pinned marshalled actions")
+            self._coarsener = _Coarsener(self, python_func, flush_size, flush_interval)
+        else:
+            self._coarsener = None
+
+    def __call__(self, target_addr, *args, sync='lsync', gate=None, lsync_lco=None, 
+                 rsync_lco=None, out_array=None):
+        """ Launch an Action. See `BaseAction.__call__` for details.
+
+        If this action is coarsened, a locally synchronized launch ('lsync') without 
+        `gate` to a single target is buffered and sent later together with other 
+        launches to the same target. In this case `rsync_lco` is set without a value 
+        when the call completes on the receiver. All other launches flush the pending 
+        buffers first and are sent directly.
+        """
+        if self._coarsener is not None:
+            is_broadcast = (isinstance(target_addr, AddressArray) or
+                            (isinstance(target_addr, GlobalAddress) and 
+                             target_addr.addr == lib.HPX_NULL))
+            if sync == 'lsync' and gate is None and not is_broadcast:
+                self._coarsener.push(BaseAction._get_addr_int(target_addr), args, 
+                                     _get_lco_addr(rsync_lco))
+                return
+            self._coarsener.flush()
+        return super(Action, self).__call__(target_addr, *args, sync=sync, gate=gate,
+                                            lsync_lco=lsync_lco, rsync_lco=rsync_lco,
+                                            out_array=out_array)
+
+    def flush(self):
+        """ Send all buffered launches of a coarsened action.
+
+        Buffers are flushed automatically when they reach `flush_size` launches or 
+        when a launch finds the buffer older than `flush_interval` milliseconds. 
+        The interval is only checked when a launch is made, never while idle, so 
+        this must be called once after the last launch of a burst, otherwise a 
+        partial buffer is never sent.
+        """
+        if self._coarsener is not None:
+            self._coarsener.flush()
 
 def create_action(key=None, marshalled='true', pinned=False, argument_types=None, 
-                  array_type=None):
+                  array_type=None, coarsen=False, flush_size=64, flush_interval=1.0,
+                  coalesced=False, compressed=False, vectored=False, pin_cache=False):
     """ Create an `Action` object.
 
     Args:
@@ -437,11 +734,38 @@ def create_action(key=None, marshalled='true', pinned=False, argument_types=None
             is 'false', this action is not marshalled, and you need to specify the 
             argument types in the `argument_types` argument.
         pinned (bool): If this action is pinned, the first argument is the pinned 
-            `GlobalAddressBlock`.
+            `GlobalAddressBlock`. If `marshalled` is 'continuous', the decorated 
+            function receives the pinned block and the numpy array argument.
         argument_types (list): Only needed if `marshalled` is 'false' when argument 
-            types are needed. This should be a list of `Type` object.
+            types are needed. This should be a list of `Type` object. An LCO argument
+            can also be specified as a tuple `(Type.LCO, None)` or 
+            `(Type.LCO, (shape, dtype))`, in which case the decorated function 
+            receives an `LCO` object instead of its address.
         array_type (numpy.dtype): Only needed if `marshalled` is `continuous` to 
             specify the type of the numpy array in the argument.
+        coarsen (bool): If this argument is True, fine-grained launches of this 
+            action to the same target are aggregated into one batched parcel and 
+            executed as a loop on the receiver. Only supported for non-pinned 
+            marshalled actions. The return value of the Python function is ignored
+            and `hpx.thread_continue` must not be used in a coarsened action.
+        flush_size (int): The number of launches after which a batch is sent.
+        flush_interval (float): The age in milliseconds after which a batch is sent
+            by the next launch to the same target. The age is only checked on a 
+            launch, so call `Action.flush` after the last launch to send remaining 
+            batches.
+        coalesced (bool): If this argument is True, parcels of this action to the same
+            locality are coalesced by the network layer. The coalescing buffer can be 
+            tuned through the arguments of `hpx.init`.
+        compressed (bool): If this argument is True, parcels of this action are 
+            compressed before sending.
+        vectored (bool): If this argument is True, every argument of this marshalled
+            action must be a C contiguous numpy array. The arrays are sent as separate
+            buffers without being concatenated or pickled, and the decorated function 
+            receives a list of zero-copy views of them (after the pinned block if 
+            `pinned` is True).
+        pin_cache (bool): If this argument is True, the decorated function runs with 
+            a `PinCache` active, so repeated pins of the same block reuse one numpy 
+            view and all of them are released together when the function returns.
     
     Returns:
         A decorator which takes a Python function to register.
@@ -450,10 +774,26 @@ def create_action(key=None, marshalled='true', pinned=False, argument_types=None
         Action must be created before `hpx.init()`.
     """
     def decorator(python_func):
-        return Action(python_func, key, marshalled, pinned, argument_types, array_type)
+        return Action(python_func, key, marshalled, pinned, argument_types, array_type,
+                      coarsen, flush_size, flush_interval, coalesced, compressed,
+                      vectored, pin_cache)
     return decorator
 
 
+@create_action()
+def _broadcast_forward(action, payload, ranks, rsync_lco):
+    # `ranks[0]` is this locality, the rest of `ranks` is split in halves and the 
+    # first rank of every upper half forwards to it, which forms a binomial tree
+    while len(ranks) > 1:
+        half = (len(ranks) + 1) // 2
+        _broadcast_forward(THERE(ranks[half]), action, payload, ranks[half:], rsync_lco)
+        ranks = ranks[:half]
+    # the local call goes through the normal launch path of the action
+    action(HERE(), *pickle.loads(payload), sync='rsync')
+    if rsync_lco is not None:
+        rsync_lco.set()
+    return SUCCESS
+
 class Function(BaseAction):
     def __init__(self, python_func, argument_types, key=None):
         return super(Function, self).__init__(python_func, lib.HPX_FUNCTION, key, 
@@ -482,6 +822,32 @@ def create_function(argument_types, key=None):
         return Function(python_func, argument_types, key)
     return decorator
 
+def _calculate_arguments_layout(arguments_cdef):
+    """ Calculate the offsets of typed arguments packed as the fields of a C struct.
+
+    Returns:
+        A tuple of the total size and a list of (offset, C type) pairs.
+    """
+    offset = 0
+    layout = []
+    for cdef in arguments_cdef:
+        align = ffi.alignof(cdef)
+        offset = (offset + align - 1) // align * align
+        layout.append((offset, cdef))
+        offset += ffi.sizeof(cdef)
+    return max(offset, 1), layout
+
+def _allocate_arguments_buffer(arguments_layout):
+    """ Allocate a buffer for the typed arguments of an action.
+
+    Returns:
+        A tuple of the buffer and the list of typed pointers to its fields.
+    """
+    size, layout = arguments_layout
+    buf = ffi.new("char[]", size)
+    pointers = [ffi.cast(cdef + " *", buf + offset) for offset, cdef in layout]
+    return buf, pointers
+
 def _parse_marshalled_args(args):
     args_bytes = bytearray(pickle.dumps(args))
     pointer = ffi.from_buffer(args_bytes)
@@ -492,7 +858,7 @@ def _parse_marshalled_args(args):
 
 # {{{ Runtime
 
-def init(argv=[]):
+def init(argv=[], coalescing_buffer_size=None, coalescing_threshold=None):
     """Initializes the HPX runtime.
     
     This must be called before other HPX functions.  hpx_init() initializes the
@@ -501,11 +867,23 @@ def init(argv=[]):
 
     Args:
         argv (list): List of command-line arguments.
+        coalescing_buffer_size (int): The number of parcels the network buffers for
+            a coalesced action before the buffer is flushed.
+        coalescing_threshold (int): The number of outstanding parcels of a 
+            coalesced action needed before the network starts coalescing.
 
     Raises:
         HPXError: If the initialization fails.
     """
     # TODO: remove hpx specifig flags in argv
+    runtime_flags = []
+    if coalescing_buffer_size is not None:
+        runtime_flags.append("--hpx-coalescing-buffersize={0}".format(coalescing_buffer_size))
+    if coalescing_threshold is not None:
+        runtime_flags.append(
+            "--hpx-coalescing-detection-threshold={0}".format(coalescing_threshold))
+    if len(runtime_flags) > 0:
+        argv = (list(argv) if len(argv) > 0 else [sys.argv[0]]) + runtime_flags
     if len(argv) == 0:
         c_argc = ffi.NULL
         c_argv_address = ffi.NULL
@@ -548,29 +926,21 @@ def run(action, *args, shape=None, dtype=None):
     entry in the context of this process.
     
     The process does not use termination detection and must be terminated
-    through a single explicit call to hpx.exit().
+    through a single explicit call to hpx.exit(). Use `Process` for work which 
+    needs termination detection.
 
     Args:
         action (hpx.BaseAction): The action to execute.
         *args: Arguments of this action.
         shape: Shape of numpy array returned.
     """
-    if action.marshalled:
-        args_pointer, size = _parse_marshalled_args(args)
-        if shape is None:
-            status = lib._hpx_run(action.id, ffi.NULL, 2, args_pointer, size)
-        else:
-            rtv = np.zeros(shape, dtype=dtype)
-            rtv_pointer = ffi.cast("void*", rtv.__array_interface__['data'][0])
-            status = lib._hpx_run(action.id, rtv_pointer, 2, args_pointer, size)
+    c_args = action._generate_arguments(None, args)
+    if shape is None:
+        status = lib._hpx_run(action.id, ffi.NULL, len(c_args), *c_args)
     else:
-        c_args = action._generate_c_arguments(*args)
-        if shape is None:
-            status = lib._hpx_run(action.id, ffi.NULL, len(c_args), *c_args)
-        else:
-            rtv = np.zeros(shape, dtype=dtype)
-            rtv_pointer = ffi.cast("void*", rtv.__array_interface__['data'][0])
-            status = lib._hpx_run(action.id, rtv_pointer, len(c_args), *c_args)
+        rtv = np.zeros(shape, dtype=dtype)
+        rtv_pointer = ffi.cast("void*", rtv.__array_interface__['data'][0])
+        status = lib._hpx_run(action.id, rtv_pointer, len(c_args), *c_args)
 
     if status != lib.HPX_SUCCESS:
         raise HPXError("hpx.run failed")
@@ -596,13 +966,86 @@ def print_help():
 def thread_current_pid():
     return lib.hpx_thread_current_pid()
 
-def bcast_rsync(action_id, *args):
-    c_args = generate_c_arguments(action_id, *args)
-    lib._hpx_process_broadcast_rsync(thread_current_pid(), action_id[0], len(c_args), *c_args)
+def bcast_rsync(action, *args):
+    """ Launch `action` on every locality and wait for all of them to complete.
+    """
+    action(NULL(), *args, sync='rsync')
+
+# {{{ Process
+
+class Process:
+
+    def __init__(self, termination_lco=None):
+        """ Create an HPX process with termination detection.
+
+        Actions launched through `Process.call`, and all actions they launch 
+        transitively, belong to this process. The runtime sets the termination LCO
+        when all of them have completed, so recursive algorithms do not need to 
+        pass completion LCOs through every call.
+
+        Args:
+            termination_lco (LCO): An LCO to be set when the process terminates. If 
+                it is None, a new Future is created and deleted with the process.
+        """
+        self._owns_lco = termination_lco is None
+        if self._owns_lco:
+            termination_lco = Future()
+        self.termination_lco = termination_lco
+        self.addr = lib.hpx_process_new(termination_lco.addr)
+        if self.addr == lib.HPX_NULL:
+            raise HPXError("process creation failed")
+
+    def call(self, target_addr, action, *args, rsync_lco=None):
+        """ Launch `action` in this process.
+
+        Args:
+            target_addr: The target of the action, see `BaseAction.__call__`.
+            action (BaseAction): The action to launch.
+            *args: The arguments of the action.
+            rsync_lco (LCO): An optional LCO to be set when the action completes.
+        """
+        target_addr_int = BaseAction._get_addr_int(target_addr)
+        c_args = action._generate_arguments(target_addr, args)
+        rtv = lib._hpx_process_call(self.addr, target_addr_int, action.id[0], 
+                                    _get_lco_addr(rsync_lco), len(c_args), *c_args)
+        if rtv != SUCCESS:
+            raise HPXError("action launch failed")
+
+    def wait(self):
+        """ Wait until all actions of this process have completed.
+        """
+        self.termination_lco.wait()
+
+    def delete(self, sync='sync', sync_lco=None):
+        """ Delete this process.
+
+        Args:
+            sync (string): can be 'sync' or 'async'. If this argument is 'async', 
+                `sync_lco` can be set to an LCO to be set when the deletion completes.
+        """
+        if sync == 'sync':
+            lco = Future()
+        elif sync == 'async':
+            lco = sync_lco
+        else:
+            raise ValueError("'sync' argument needs to be either 'sync' or 'async'")
+        lib.hpx_process_delete(self.addr, _get_lco_addr(lco))
+        if sync == 'sync':
+            lco.wait()
+            lco.delete()
+        if self._owns_lco:
+            self.termination_lco.delete()
+
+# }}}
 
 # {{{ GlobalAddress
 
 class GlobalAddress:
+    # A GlobalAddress is a displacement from a base address. The displaced address
+    # is only computed through hpx_addr_add when it is first needed, so chained
+    # arithmetic costs a single FFI call. Addresses with the same base are compared
+    # by offset; hashing resolves the address once and caches it.
+    __slots__ = ('_base', '_offset', '_addr', 'bsize')
 
     def __init__(self, addr, bsize=-1):
         """Constructor for GlobalAddr class.
@@ -611,9 +1054,42 @@ class GlobalAddress:
             addr (int): The address in global memory space
             bsize (int): The block size used when allocating memory associated with `addr`.
         """
-        self.addr = addr
+        self._base = addr
+        self._offset = 0
+        self._addr = addr
         self.bsize = bsize
 
+    @classmethod
+    def _displaced(cls, base, offset, bsize):
+        """ Create a GlobalAddress `offset` bytes from `base` without resolving it.
+        """
+        global_addr = cls.__new__(cls)
+        global_addr._base = base
+        global_addr._offset = offset
+        global_addr._addr = base if offset == 0 else None
+        global_addr.bsize = bsize
+        return global_addr
+
+    @property
+    def addr(self):
+        """ The address in global memory space (int).
+        """
+        if self._addr is None:
+            self._addr = lib.hpx_addr_add(self._base, self._offset, self.bsize)
+        return self._addr
+
+    def __eq__(self, other):
+        if not isinstance(other, GlobalAddress):
+            return NotImplemented
+        if self._base == other._base:
+            return self._offset == other._offset
+        return self.addr == other.addr
+
+    def __hash__(self):
+        # equal addresses may have different bases, so only the resolved address
+        # gives a consistent hash
+        return hash(self.addr)
+
     def __add__(self, bytes):
         """Perform global address displacement arithmetic.
 
@@ -622,8 +1098,7 @@ class GlobalAddress:
         address associated with the same allocation as `addr`, or 
         one-off-the-end if the allocation was an array.
         """
-        return GlobalAddress(lib.hpx_addr_add(self.addr, bytes, self.bsize), 
-                             self.bsize)
+        return GlobalAddress._displaced(self._base, self._offset + int(bytes), self.bsize)
 
     def __radd__(self, bytes):
         """See GlobalAddress.__add__ for details.
@@ -640,9 +1115,11 @@ class GlobalAddress:
         performed. In addition, self and other must be part of the same 
         allocation.
         """
-        if isinstance(other, int):
-            return GlobalAddress(lib.hpx_addr_add(self.addr, -other, self.bsize), self.bsize)
+        if isinstance(other, (int, np.integer)):
+            return GlobalAddress._displaced(self._base, self._offset - int(other), self.bsize)
         elif isinstance(other, GlobalAddress):
+            if other._base == self._base:
+                return self._offset - other._offset
             return lib.hpx_addr_sub(self.addr, other.addr, self.bsize)
         else:
             raise TypeError("Invalid data type")
@@ -674,7 +1151,7 @@ class GlobalAddress:
             else:
                 return int(ffi.cast("uintptr_t", local[0]))
         else:
-            rtv = lib.hpx_gas_try_pin(self._addr, ffi.NULL)
+            rtv = lib.hpx_gas_try_pin(self.addr, ffi.NULL)
             if rtv != 1:
                 raise HPXError("Pinning the global memory fails")
 
@@ -683,6 +1160,44 @@ class GlobalAddress:
         """
         lib.hpx_gas_unpin(self.addr)                
 
+    def fetch_add(self, value, dtype=np.int64):
+        """Atomically add `value` to the element at this address.
+
+        The addition runs as a native action on the owning locality without 
+        entering Python there.
+
+        Args:
+            value: The value to add.
+            dtype (numpy.dtype): The data type of the element, either int64 or float64.
+
+        Returns:
+            The value of the element before the addition.
+        """
+        return AddressArray([self.addr]).fetch_add(value, dtype)[0]
+
+    def cas(self, expected, desired):
+        """Atomically replace the int64 element at this address by `desired` if it
+        equals `expected`.
+
+        Returns:
+            The value of the element before the operation. The swap succeeded if it 
+            equals `expected`.
+        """
+        return AddressArray([self.addr]).cas(expected, desired)[0]
+
+    def atomic_accumulate(self, array, op='sum', sync='rsync', lsync_lco=None, 
+                          rsync_lco=None):
+        """Atomically combine `array` into the consecutive elements at this address.
+
+        Args:
+            array (numpy.ndarray): An int64 or float64 numpy array.
+            op (string): 'sum', 'min' or 'max'.
+
+        See `AddressArray.atomic_accumulate` for the other arguments.
+        """
+        AddressArray([self.addr]).atomic_accumulate(array.reshape((1, -1)), op, sync,
+                                                    lsync_lco, rsync_lco)
+
 def THERE(locality_number):
     """ Get the global address representing some other locality, that is
     suitable for use as a parcel target.
@@ -727,164 +1242,699 @@ def HERE():
 
 # }}}
 
-# {{{ GlobalAddressBlock
+# {{{ AddressArray
 
-def _currentdim_is_slice(sliceObj, dimLimit):
-    if sliceObj.start == None:
-        start = 0
-    else:
-        start = sliceObj.start
-    if sliceObj.stop == None:
-        stop = dimLimit
-    else:
-        stop = sliceObj.stop
-    return start, stop
+def _get_array_pointer(array, c_type="void *"):
+    """ Helper function to get a pointer of type `c_type` to the data of a numpy array.
+    """
+    return ffi.cast(c_type, array.__array_interface__['data'][0])
 
-class DummyArray:
-    # This class is used for constructing new arrays in GlobalAddressBlock.try_pin
-    def __init__(self, data, strides, shape, dtype):
-        self.__array_interface__ = {}
-        self.__array_interface__['data'] = (data, False)
-        self.__array_interface__['strides'] = strides
-        self.__array_interface__['shape'] = shape
-        self.__array_interface__['typestr'] = dtype.str
-        self.__array_interface__['descr'] = dtype.descr
+class AddressArray:
 
-def construct_array(addr, shape, dtype, strides=None):
-    dummy_array = DummyArray(addr, strides, shape, dtype)
-    return np.array(dummy_array, copy=False, dtype=dtype)
+    def __init__(self, addrs, bsize=-1):
+        """Constructor for AddressArray class.
 
-class GlobalAddressBlock:
-    def __init__(self, addr, shape, dtype, strides):
-        """Constructor of a GlobalAddressBlock object
+        An AddressArray object represents many global addresses at once. The 
+        addresses are stored in a one-dimensional numpy array of type uint64, so
+        raw addresses stored in structured numpy arrays can be used directly.
 
         Args:
-            addr (GlobalAddr): The starting address of this block.
-            dtype (numpy.dtype): The type of each object in address block.
+            addrs (array_like): The addresses in global memory space.
+            bsize (int): The block size used when allocating memory associated with
+                `addrs`.
         """
-        self.addr = addr
-        self.shape = shape
-        self.dtype = dtype
-        self.strides = strides
-    
-    def __getitem__(self, key):
-
-        # convert key (maybe int, slice or tuple) to tuple
-        if isinstance(key, int) or isinstance(key, slice):
-            keyWrap = (key,)
-        elif isinstance(key, tuple):
-            keyWrap = key
-        else:
-            raise TypeError("Invalid key type")
-        
-        newAddr = copy.copy(self.addr)
-        newShape = []
-        newStrides = []
+        self.addrs = np.ascontiguousarray(addrs, dtype=np.uint64).reshape(-1)
+        self.bsize = bsize
 
-        for i in range(len(keyWrap)):
-            if isinstance(keyWrap[i], int):
-                if keyWrap[i] >= self.shape[i] or keyWrap[i] < 0:
-                    raise RuntimeError("GlobalAddressBlock object index out of bound")
-                newAddr += keyWrap[i]*self.strides[i]
-            elif isinstance(keyWrap[i], slice):
-                start, stop = _currentdim_is_slice(keyWrap[i], self.shape[i])
-                if start >= self.shape[i] or start < 0 or stop > self.shape[i] or stop < 0:
-                    raise RuntimeError("GlobalAddressBlock object index out of bound")
-                newAddr += start*self.strides[i]
-                newShape.append(stop - start)
-                newStrides.append(self.strides[i])
-            else:
-                raise TypeError("Invalid key type in dimension " + str(i))
+    @classmethod
+    def from_offsets(cls, base, offsets):
+        """Create an AddressArray by displacing one address by many offsets.
 
-        newShape = tuple(newShape)
-        newStrides = tuple(newStrides)
+        Args:
+            base (GlobalAddress): The address to displace.
+            offsets (array_like): The displacement in bytes of each address.
+        """
+        offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        addrs = np.full(offsets.shape, base.addr, dtype=np.uint64)
+        return cls(addrs, base.bsize) + offsets
 
-        # if the indexing does not cover all dimension, fill in the remaining dimensions
-        newShape += self.shape[len(keyWrap):]
-        newStrides += self.strides[len(keyWrap):]
+    def __len__(self):
+        return self.addrs.shape[0]
 
-        # if a single element is left, the shape should be (1,)
-        if newShape == tuple():
-            newShape = (1,)
-            newStrides = (self.strides[-1],)
+    def __iter__(self):
+        for addr in self.addrs:
+            yield GlobalAddress(int(addr), self.bsize)
 
-        return GlobalAddressBlock(newAddr, newShape, self.dtype, newStrides)  
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return GlobalAddress(int(self.addrs[key]), self.bsize)
+        return AddressArray(self.addrs[key], self.bsize)
 
-    def try_pin(self):
-        """ Performs address translation. See `Addr.try_pin` for detail.
+    def __add__(self, bytes):
+        """Perform global address displacement arithmetic on every address.
 
-        Returns:
-            A numpy array representing this address block.
+        Args:
+            bytes (Union[int, array_like]): The displacement in bytes, either the 
+                same for all addresses or one for each address.
         """
-        addrLocal = self.addr.try_pin(True)
-        dummy_array = DummyArray(addrLocal, self.strides, self.shape, self.dtype)
-        return np.array(dummy_array, copy=False, dtype=self.dtype)
+        bytes = np.ascontiguousarray(np.broadcast_to(np.asarray(bytes, dtype=np.int64),
+                                                     self.addrs.shape))
+        out = np.empty_like(self.addrs)
+        lib.pyhpx_addr_add_n(_get_array_pointer(self.addrs, "hpx_addr_t *"),
+                             _get_array_pointer(bytes, "int64_t *"),
+                             _get_array_pointer(out, "hpx_addr_t *"), len(self), self.bsize)
+        return AddressArray(out, self.bsize)
 
-    def unpin(self):
-        """ Unpin this address block.
+    def __radd__(self, bytes):
+        """See AddressArray.__add__ for details.
         """
-        self.addr.unpin()
+        return self.__add__(bytes)
 
-    def iscontinuous(self):
-        """ Test whether current memory block is countinous.
+    def __sub__(self, bytes):
+        return self.__add__(-np.asarray(bytes, dtype=np.int64))
 
-        This method is used by get, set and try_pin for checking.
-        """
-        # discard first few dimensions where the size is 1
-        i = 0
-        while self.shape[i] == 1:
-            i += 1
-            if i == len(self.shape):
-                break
+    def owners(self):
+        """Get the rank of the locality owning each address.
 
-        # at here, i is the first dimension not having size 1
-        i += 1
-        while i < len(self.shape):
-            if self.shape[i] != self.strides[i-1]//self.strides[i]:
-                return False
-            i += 1
+        The owner of every distinct address is looked up with a small action sent 
+        to that address. All lookups are in flight at once and the call returns 
+        when the last one has replied, so the cost is one round trip plus one 
+        message per distinct address. Passing one address per block rather than 
+        per element keeps the number of messages low.
 
-        # test last dimension has strides of itemsize
-        if self.strides[-1] != self.dtype.itemsize:
-            return False
-        
-        return True
+        Returns:
+            A numpy array of ranks.
+        """
+        unique_addrs, inverse = np.unique(self.addrs, return_inverse=True)
+        ranks = np.empty(unique_addrs.shape, dtype=np.intc)
+        rtv = lib.pyhpx_addr_owner_n(_get_array_pointer(unique_addrs, "hpx_addr_t *"),
+                                     _get_array_pointer(ranks, "int *"), len(unique_addrs))
+        if rtv != SUCCESS:
+            raise HPXError("owner lookup failed")
+        return ranks[inverse]
 
-    def get(self, sync='sync', lsync_lco=None):
-        """ This copies data from a global address to a local buffer.
+    def get(self, dtype, shape=(), out_array=None):
+        """Copy an element from every address into one local array.
 
-        This operation is not atomic. GlobalAddressBlock.get with concurrent 
-        GlobalAddressBlock.set to overlapping addresses ranges will result in
-        a data race with undefined behavior. Users should synchronize with 
-        some out-of-band mechanism.
+        All copies are issued concurrently.
 
         Args:
-            sync (string): can be 'sync' or 'async'
+            dtype (numpy.dtype): The data type of the element at each address.
+            shape (tuple): The shape of the element at each address.
+            out_array (numpy.ndarray): An optional C contiguous destination array of 
+                shape `(len(self),) + shape`.
+
+        Returns:
+            A numpy array of shape `(len(self),) + shape`.
         """
+        dtype = np.dtype(dtype)
+        if out_array is None:
+            out_array = np.empty((len(self),) + tuple(shape), dtype=dtype)
+        elif not out_array.flags['C_CONTIGUOUS']:
+            raise RuntimeError("out_array argument must be C contiguous")
+        sizes = np.full(self.addrs.shape, _calculate_block_size(shape) * dtype.itemsize,
+                        dtype=np.uintp)
+        done = Future()
+        rtv = lib.pyhpx_gas_memget_v(_get_array_pointer(out_array), 
+                                     _get_array_pointer(self.addrs, "hpx_addr_t *"), 
+                                     _get_array_pointer(sizes, "size_t *"), len(self), 
+                                     done.addr)
+        if rtv != SUCCESS:
+            raise HPXError("memget failed")
+        done.wait()
+        done.delete()
+        return out_array
 
-        # get only works on continuous memory block
-        if not self.iscontinuous():
-            raise RuntimeError("GlobalAddressBlock.get must be applied on a continuous block")
+    def set(self, from_array, sync='rsync', lsync_lco=None, rsync_lco=None):
+        """Copy one element of `from_array` to every address.
 
-        i = 0
-        while self.shape[i] == 1 and i < len(self.shape) - 1:
-            i += 1
-        size = self.shape[i]*self.strides[i]
+        All copies are issued concurrently. The LCOs are set once when all copies
+        are completed.
 
-        array = np.zeros((size//self.dtype.itemsize,), dtype=self.dtype).reshape(self.shape)
+        Args:
+            from_array (numpy.ndarray): A C contiguous numpy array whose first 
+                dimension is `len(self)`.
+            sync (string): This argument can be 'async', 'lsync', 'rsync'. See 
+                `GlobalAddressBlock.set` for details.
+            lsync_lco (LCO): An LCO object to be set when `from_array` can be reused.
+            rsync_lco (LCO): An LCO object to be set when all copies are completed.
+        """
+        if not from_array.flags['C_CONTIGUOUS']:
+            raise RuntimeError("from_array argument must be C contiguous")
+        if from_array.shape[0] != len(self):
+            raise ValueError("from_array must have one element for every address")
+        sizes = np.full(self.addrs.shape, from_array.nbytes // max(len(self), 1), 
+                        dtype=np.uintp)
 
-        if sync == 'sync':
-            lib.hpx_gas_memget_sync(ffi.cast("void *", array.__array_interface__['data'][0]), 
-                                    self.addr.addr, size)
-            return array
-        elif sync == 'async':
-            # TODO: How??
-            pass
-        else:
-            raise ValueError("'sync' argument needs to be either 'sync' or 'async'")
+        if sync == 'rsync':
+            lsync_lco = None
+            rsync_lco = Future()
+        elif sync == 'lsync':
+            lsync_lco = Future()
+        elif sync != 'async':
+            raise ValueError("'sync' argument can only be 'rsync', 'lsync' or 'async'")
+
+        rtv = lib.pyhpx_gas_memput_v(_get_array_pointer(self.addrs, "hpx_addr_t *"),
+                                     _get_array_pointer(from_array),
+                                     _get_array_pointer(sizes, "size_t *"), len(self),
+                                     _get_lco_addr(lsync_lco), _get_lco_addr(rsync_lco))
+        if rtv != SUCCESS:
+            raise HPXError("memput failed")
 
-    def set(self, from_array, sync='rsync', lsync_lco=None, rsync_lco=None):
-        """ This method copies data from a local buffer to the global memory block this object referenced.
+        if sync == 'rsync':
+            rsync_lco.wait()
+            rsync_lco.delete()
+        elif sync == 'lsync':
+            lsync_lco.wait()
+            lsync_lco.delete()
+
+    def fetch_add(self, values, dtype=np.int64):
+        """Atomically add a value to the element at every address.
+
+        The additions run as native actions on the owning localities without 
+        entering Python there. All additions are issued concurrently.
+
+        Args:
+            values: A scalar or a numpy array with one value for every address.
+            dtype (numpy.dtype): The data type of the elements, either int64 or 
+                float64.
+
+        Returns:
+            A numpy array of the values before the additions.
+        """
+        return self._fetch_op(values, 'sum', dtype)
+
+    def _fetch_op(self, values, op, dtype):
+        dtype, c_type = _atomic_type(dtype)
+        values = np.ascontiguousarray(np.broadcast_to(np.asarray(values, dtype=dtype), 
+                                                      self.addrs.shape))
+        old = np.empty(self.addrs.shape, dtype=dtype)
+        rtv = lib.pyhpx_atomic_fetch_op_n(_get_array_pointer(self.addrs, "hpx_addr_t *"),
+                                          _atomic_ops[op], c_type, 
+                                          _get_array_pointer(values, "uint64_t *"),
+                                          _get_array_pointer(old, "uint64_t *"), len(self))
+        if rtv != SUCCESS:
+            raise HPXError("atomic operation failed")
+        return old
+
+    def cas(self, expected, desired):
+        """Atomically compare and swap the int64 element at every address.
+
+        The element at an address is replaced by its `desired` value only if it 
+        equals its `expected` value.
+
+        Args:
+            expected: A scalar or a numpy array with one value for every address.
+            desired: A scalar or a numpy array with one value for every address.
+
+        Returns:
+            A numpy array of the values before the operation. A swap succeeded where
+            the returned value equals `expected`.
+        """
+        expected = np.ascontiguousarray(np.broadcast_to(np.asarray(expected, dtype=np.int64),
+                                                        self.addrs.shape))
+        desired = np.ascontiguousarray(np.broadcast_to(np.asarray(desired, dtype=np.int64),
+                                                       self.addrs.shape))
+        old = np.empty(self.addrs.shape, dtype=np.int64)
+        rtv = lib.pyhpx_atomic_cas_n(_get_array_pointer(self.addrs, "hpx_addr_t *"),
+                                     _get_array_pointer(expected, "int64_t *"),
+                                     _get_array_pointer(desired, "int64_t *"),
+                                     _get_array_pointer(old, "int64_t *"), len(self))
+        if rtv != SUCCESS:
+            raise HPXError("atomic operation failed")
+        return old
+
+    def atomic_accumulate(self, values, op='sum', sync='rsync', lsync_lco=None, 
+                          rsync_lco=None):
+        """Atomically combine a row of `values` into the elements at every address.
+
+        Each element is combined atomically, but a row as a whole is not. This is 
+        meant for concurrent updates such as histograms.
+
+        Args:
+            values (numpy.ndarray): An int64 or float64 numpy array whose first 
+                dimension is `len(self)`. Row `i` is combined into the consecutive 
+                elements starting at address `i`.
+            op (string): 'sum', 'min' or 'max'.
+            sync (string): This argument can be 'async', 'lsync', 'rsync'. See 
+                `GlobalAddressBlock.set` for details.
+            lsync_lco (LCO): An LCO object to be set when `values` can be reused.
+            rsync_lco (LCO): An LCO object to be set when all updates are completed.
+        """
+        dtype, c_type = _atomic_type(values.dtype)
+        if values.shape[0] != len(self):
+            raise ValueError("values must have one row for every address")
+        values = np.ascontiguousarray(values)
+        count = values.size // max(len(self), 1)
+
+        if sync == 'rsync':
+            lsync_lco = None
+            rsync_lco = Future()
+        elif sync != 'lsync' and sync != 'async':
+            raise ValueError("'sync' argument can only be 'rsync', 'lsync' or 'async'")
+
+        rtv = lib.pyhpx_atomic_accumulate_n(_get_array_pointer(self.addrs, "hpx_addr_t *"),
+                                            _atomic_ops[op], c_type, 
+                                            _get_array_pointer(values), count, len(self),
+                                            _get_lco_addr(lsync_lco), 
+                                            _get_lco_addr(rsync_lco))
+        if rtv != SUCCESS:
+            raise HPXError("atomic operation failed")
+
+        if sync == 'rsync':
+            rsync_lco.wait()
+            rsync_lco.delete()
+
+_atomic_ops = {'sum': lib.PYHPX_ATOMIC_SUM, 'min': lib.PYHPX_ATOMIC_MIN, 
+               'max': lib.PYHPX_ATOMIC_MAX}
+
+def _atomic_type(dtype):
+    """ Helper function for the type code of an atomic operation on `dtype`.
+    """
+    dtype = np.dtype(dtype)
+    if dtype == np.int64:
+        return dtype, lib.PYHPX_ATOMIC_INT64
+    elif dtype == np.float64:
+        return dtype, lib.PYHPX_ATOMIC_DOUBLE
+    raise TypeError("atomic operations only support int64 and float64")
+
+# }}}
+
+# {{{ GlobalAddressBlock
+
+def _currentdim_is_slice(sliceObj, dimLimit):
+    if sliceObj.start == None:
+        start = 0
+    else:
+        start = sliceObj.start
+    if sliceObj.stop == None:
+        stop = dimLimit
+    else:
+        stop = sliceObj.stop
+    return start, stop
+
+def _view_span(shape, strides, itemsize):
+    """ Helper function for the number of bytes spanned by a strided view.
+    """
+    if strides is None:
+        return _calculate_block_size(shape) * itemsize
+    if any(dim == 0 for dim in shape):
+        return 0
+    return sum((dim - 1) * stride for dim, stride in zip(shape, strides)) + itemsize
+
+def construct_array(addr, shape, dtype, strides=None, span=None):
+    """ Construct a numpy array viewing local memory.
+
+    Args:
+        addr (int): The local address of the first element.
+        shape (tuple): The shape of the array.
+        dtype (numpy.dtype): The data type of the array.
+        strides (tuple): The strides in bytes, C order if None.
+        span (int): The number of bytes spanned by the array, computed from `shape` 
+            and `strides` if None.
+
+    Returns:
+        A numpy array sharing the memory at `addr`.
+    """
+    if span is None:
+        span = _view_span(shape, strides, dtype.itemsize)
+    buf = ffi.buffer(ffi.cast("char *", addr), span)
+    return np.ndarray(shape, dtype, buffer=buf, strides=strides)
+
+# The active pin cache of every HPX lightweight thread, keyed by its TLS id. A 
+# lightweight thread can block and resume on another worker, so the cache cannot
+# be stored per OS thread.
+_pin_caches = {}
+
+def _active_pin_cache():
+    return _pin_caches.get(lib.hpx_thread_get_tls_id())
+
+class PinCache:
+
+    def __init__(self):
+        """ A scope in which pinned blocks are cached and unpinned together.
+
+        While a PinCache is active on the current HPX thread, `GlobalAddressBlock.try_pin` 
+        reuses the numpy view of a block pinned earlier in the scope, and 
+        `GlobalAddressBlock.unpin` is deferred. All pins are released in one batch 
+        when the scope exits, also when it exits with an exception.
+
+        Example:
+            with hpx.PinCache():
+                for i in range(n):
+                    block.try_pin()[i] += 1
+                    block.unpin()
+        """
+        self._views = {}
+        self._addrs = []
+        self._pinned = set()
+        self._outer = None
+        self._thread = None
+
+    def pin(self, block):
+        """ Pin `block` or return its cached numpy view.
+        """
+        key = (block.addr.addr, block.shape, block.strides, block.dtype.str)
+        view = self._views.get(key)
+        if view is None:
+            local = block.addr.try_pin(True)
+            self._addrs.append(key[0])
+            self._pinned.add(key[0])
+            view = construct_array(local, block.shape, block.dtype, block.strides,
+                                   block._span)
+            self._views[key] = view
+        return view
+
+    def holds(self, addr):
+        """ Whether the address `addr` (int) was pinned through this cache.
+        """
+        return addr in self._pinned
+
+    def release(self):
+        """ Unpin all blocks pinned through this cache.
+        """
+        if len(self._addrs) > 0:
+            addrs = np.array(self._addrs, dtype=np.uint64)
+            lib.pyhpx_gas_unpin_n(_get_array_pointer(addrs, "hpx_addr_t *"), len(addrs))
+        self._views = {}
+        self._addrs = []
+        self._pinned = set()
+
+    def __enter__(self):
+        self._thread = lib.hpx_thread_get_tls_id()
+        self._outer = _pin_caches.get(self._thread)
+        _pin_caches[self._thread] = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._outer is None:
+            del _pin_caches[self._thread]
+        else:
+            _pin_caches[self._thread] = self._outer
+        self._outer = None
+        self._thread = None
+        self.release()
+        return False
+
+def _with_pin_cache(python_func):
+    @functools.wraps(python_func)
+    def wrapper(*args):
+        with PinCache():
+            return python_func(*args)
+    return wrapper
+
+def _contiguous_runs(shape, strides, itemsize):
+    """ Helper function for decomposing a strided block into contiguous runs.
+
+    Trailing dimensions which are laid out contiguously are merged into one run.
+
+    Returns:
+        A tuple of a numpy array of the byte offset of each run in C order and the 
+        size in bytes of every run.
+    """
+    run_size = itemsize
+    merged = len(shape)
+    while merged > 0 and (strides[merged-1] == run_size or shape[merged-1] == 1):
+        run_size *= shape[merged-1]
+        merged -= 1
+    return _index_offsets(shape[:merged], strides[:merged]), run_size
+
+def _paired_runs(shape, src_strides, dst_strides, itemsize):
+    """ Helper function for decomposing a copy between two strided blocks of the same
+    shape into contiguous runs.
+
+    Trailing dimensions which are laid out contiguously in both blocks are merged 
+    into one run.
+
+    Returns:
+        A tuple of the byte offsets of each run in the source, the byte offsets of 
+        each run in the destination and the size in bytes of every run.
+    """
+    run_size = itemsize
+    merged = len(shape)
+    while merged > 0 and (shape[merged-1] == 1 or (src_strides[merged-1] == run_size and 
+                                                    dst_strides[merged-1] == run_size)):
+        run_size *= shape[merged-1]
+        merged -= 1
+    return (_index_offsets(shape[:merged], src_strides[:merged]), 
+            _index_offsets(shape[:merged], dst_strides[:merged]), run_size)
+
+def _copy_runs(src_addr, dst_addr, src_offsets, dst_offsets, run_size, sync, rsync_lco):
+    """ Helper function for copying runs between two global allocations.
+
+    Args:
+        src_addr (GlobalAddress): The base address of the source runs.
+        dst_addr (GlobalAddress): The base address of the destination runs.
+    """
+    if sync not in ('sync', 'async'):
+        raise ValueError("'sync' argument needs to be either 'sync' or 'async'")
+
+    if len(src_offsets) == 1:
+        src = src_addr + int(src_offsets[0])
+        dst = dst_addr + int(dst_offsets[0])
+        if sync == 'sync':
+            rtv = lib.hpx_gas_memcpy_sync(dst.addr, src.addr, run_size)
+        else:
+            rtv = lib.hpx_gas_memcpy(dst.addr, src.addr, run_size, _get_lco_addr(rsync_lco))
+        if rtv != SUCCESS:
+            raise HPXError("memcpy failed")
+        return
+
+    if sync == 'sync':
+        copy_lco = Future()
+    else:
+        copy_lco = rsync_lco
+    src = AddressArray.from_offsets(src_addr, src_offsets)
+    dst = AddressArray.from_offsets(dst_addr, dst_offsets)
+    rtv = lib.pyhpx_gas_memcpy_v(_get_array_pointer(dst.addrs, "hpx_addr_t *"),
+                                 _get_array_pointer(src.addrs, "hpx_addr_t *"),
+                                 run_size, len(src), _get_lco_addr(copy_lco))
+    if rtv != SUCCESS:
+        raise HPXError("memcpy failed")
+    if sync == 'sync':
+        copy_lco.wait()
+        copy_lco.delete()
+
+def _index_offsets(shape, strides):
+    """ Helper function for calculating the byte offset of every index of `shape`
+    in C order.
+    """
+    offsets = np.zeros((1,), dtype=np.int64)
+    for i in range(len(shape)):
+        offsets = (offsets[:, np.newaxis] + 
+                   np.arange(shape[i], dtype=np.int64) * strides[i]).reshape(-1)
+    return offsets
+
+class GlobalAddressBlock:
+    def __init__(self, addr, shape, dtype, strides):
+        """Constructor of a GlobalAddressBlock object
+
+        Args:
+            addr (GlobalAddr): The starting address of this block.
+            dtype (numpy.dtype): The type of each object in address block.
+        """
+        self.addr = addr
+        self.shape = shape
+        self.dtype = dtype
+        self.strides = strides
+        self._span = _view_span(shape, strides, dtype.itemsize)
+        # the view of the last pin, reused while the block translates to the same 
+        # local address
+        self._view = None
+        self._view_addr = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_view'] = None
+        state['_view_addr'] = None
+        return state
+    
+    def __getitem__(self, key):
+
+        # convert key (maybe int, slice or tuple) to tuple
+        if isinstance(key, int) or isinstance(key, slice):
+            keyWrap = (key,)
+        elif isinstance(key, tuple):
+            keyWrap = key
+        else:
+            raise TypeError("Invalid key type")
+        
+        offset = 0
+        newShape = []
+        newStrides = []
+
+        for i in range(len(keyWrap)):
+            if isinstance(keyWrap[i], int):
+                if keyWrap[i] >= self.shape[i] or keyWrap[i] < 0:
+                    raise RuntimeError("GlobalAddressBlock object index out of bound")
+                offset += keyWrap[i]*self.strides[i]
+            elif isinstance(keyWrap[i], slice):
+                start, stop = _currentdim_is_slice(keyWrap[i], self.shape[i])
+                if start >= self.shape[i] or start < 0 or stop > self.shape[i] or stop < 0:
+                    raise RuntimeError("GlobalAddressBlock object index out of bound")
+                offset += start*self.strides[i]
+                newShape.append(stop - start)
+                newStrides.append(self.strides[i])
+            else:
+                raise TypeError("Invalid key type in dimension " + str(i))
+
+        newShape = tuple(newShape)
+        newStrides = tuple(newStrides)
+
+        # if the indexing does not cover all dimension, fill in the remaining dimensions
+        newShape += self.shape[len(keyWrap):]
+        newStrides += self.strides[len(keyWrap):]
+
+        # if a single element is left, the shape should be (1,)
+        if newShape == tuple():
+            newShape = (1,)
+            newStrides = (self.strides[-1],)
+
+        return GlobalAddressBlock(self.addr + offset, newShape, self.dtype, newStrides)
+
+    def try_pin(self):
+        """ Performs address translation. See `Addr.try_pin` for detail.
+
+        Returns:
+            A numpy array representing this address block.
+        """
+        cache = _active_pin_cache()
+        if cache is not None:
+            return cache.pin(self)
+        addrLocal = self.addr.try_pin(True)
+        if addrLocal != self._view_addr:
+            self._view = construct_array(addrLocal, self.shape, self.dtype, self.strides,
+                                         self._span)
+            self._view_addr = addrLocal
+        return self._view
+
+    def unpin(self):
+        """ Unpin this address block.
+
+        If the block was pinned through an active `PinCache`, the unpin is deferred 
+        until the cache is released.
+        """
+        cache = _active_pin_cache()
+        if cache is not None and cache.holds(self.addr.addr):
+            return
+        self.addr.unpin()
+
+    @contextmanager
+    def pinned(self):
+        """ Pin this address block for the duration of a `with` statement.
+
+        Example:
+            with block.pinned() as array:
+                array += 1
+
+        The block is unpinned when the statement exits, also when an exception is 
+        raised.
+        """
+        array = self.try_pin()
+        try:
+            yield array
+        finally:
+            self.unpin()
+
+    def iscontinuous(self):
+        """ Test whether current memory block is countinous.
+
+        This method is used by get, set and try_pin for checking.
+        """
+        # discard first few dimensions where the size is 1
+        i = 0
+        while self.shape[i] == 1:
+            i += 1
+            if i == len(self.shape):
+                break
+
+        # at here, i is the first dimension not having size 1
+        i += 1
+        while i < len(self.shape):
+            if self.shape[i] != self.strides[i-1]//self.strides[i]:
+                return False
+            i += 1
+
+        # test last dimension has strides of itemsize
+        if self.strides[-1] != self.dtype.itemsize:
+            return False
+        
+        return True
+
+    def get(self, sync='sync', lsync_lco=None, out_array=None):
+        """ This copies data from a global address to a local buffer.
+
+        This operation is not atomic. GlobalAddressBlock.get with concurrent 
+        GlobalAddressBlock.set to overlapping addresses ranges will result in
+        a data race with undefined behavior. Users should synchronize with 
+        some out-of-band mechanism.
+
+        If this block is not continuous, it is decomposed into contiguous runs
+        which are copied concurrently, so only the bytes of this block are moved.
+
+        Args:
+            sync (string): can be 'sync' or 'async'. If this argument is 'async', 
+                this method returns immediately, and several gets can be issued 
+                back-to-back to overlap communication with computation.
+            lsync_lco (LCO): An LCO object to be set when the data has arrived in the
+                local buffer. This is only meaningful when `sync` is 'async'. If it
+                is None, a new Future is created.
+            out_array (numpy.ndarray): An optional C contiguous numpy array of the
+                same number of bytes as this block to copy into.
+
+        Returns:
+            The local numpy array if `sync` is 'sync'. A tuple of the local numpy 
+            array and the LCO signaling its arrival if `sync` is 'async'.
+        """
+        offsets, run_size = _contiguous_runs(self.shape, self.strides, self.dtype.itemsize)
+        size = len(offsets) * run_size
+
+        if out_array is None:
+            array = np.empty(self.shape, dtype=self.dtype)
+        elif not out_array.flags['C_CONTIGUOUS'] or out_array.nbytes != size:
+            raise RuntimeError("out_array argument must be C contiguous and match the block size")
+        else:
+            array = out_array
+        to_addr = ffi.cast("void *", array.__array_interface__['data'][0])
+
+        if sync not in ('sync', 'async'):
+            raise ValueError("'sync' argument needs to be either 'sync' or 'async'")
+
+        if sync == 'sync' and len(offsets) == 1:
+            if lib.hpx_gas_memget_sync(to_addr, self.addr.addr, size) != SUCCESS:
+                raise HPXError("memget failed")
+            return array
+
+        if sync == 'sync' or lsync_lco is None:
+            get_lco = Future()
+        else:
+            get_lco = lsync_lco
+        if len(offsets) == 1:
+            rtv = lib.hpx_gas_memget(to_addr, self.addr.addr, size, get_lco.addr)
+            if rtv != SUCCESS:
+                raise HPXError("memget failed")
+        else:
+            # all runs are completed on one LCO
+            addrs = AddressArray.from_offsets(self.addr, offsets)
+            sizes = np.full(offsets.shape, run_size, dtype=np.uintp)
+            rtv = lib.pyhpx_gas_memget_v(to_addr, _get_array_pointer(addrs.addrs, "hpx_addr_t *"),
+                                         _get_array_pointer(sizes, "size_t *"), len(addrs),
+                                         get_lco.addr)
+            if rtv != SUCCESS:
+                raise HPXError("memget failed")
+
+        if sync == 'sync':
+            get_lco.wait()
+            get_lco.delete()
+            return array
+        return array, get_lco
+
+    def set(self, from_array, sync='rsync', lsync_lco=None, rsync_lco=None):
+        """ This method copies data from a local buffer to the global memory block this object referenced.
+
+        If this block is not continuous, it is decomposed into contiguous runs
+        which are copied concurrently. The LCOs are set once when all runs are 
+        completed.
 
         Args:
             from_array (numpy.ndarray): A numpy array whose content to be copied.
@@ -894,31 +1944,55 @@ class GlobalAddressBlock:
             rsync_lco (LCO): An LCO object to be set when the remote setting is completed.
         """
 
-        # test the global address is continous
-        if not self.iscontinuous():
-            raise RuntimeError("GlobalAddressBlock.set must be applied on a contiguous block")
-
         # test `from` is countinous
         if not from_array.flags['C_CONTIGUOUS']:
             raise RuntimeError("from_array argument must be C contiguous")
         from_addr = ffi.cast("void *", from_array.__array_interface__['data'][0])
 
-        i = 0
-        while self.shape[i] == 1 and i < len(self.shape) - 1:
-            i += 1
-        size = self.shape[i] * self.strides[i]
+        offsets, run_size = _contiguous_runs(self.shape, self.strides, self.dtype.itemsize)
+        size = len(offsets) * run_size
+        if from_array.nbytes != size:
+            raise RuntimeError("from_array argument must match the block size")
 
-        lsync_addr = _get_lco_addr(lsync_lco)
-        rsync_addr = _get_lco_addr(rsync_lco)
+        if len(offsets) == 1:
+            lsync_addr = _get_lco_addr(lsync_lco)
+            rsync_addr = _get_lco_addr(rsync_lco)
 
-        if sync == 'rsync':
-            lib.hpx_gas_memput_rsync(self.addr.addr, from_addr, size)
-        elif sync == 'lsync':
-            lib.hpx_gas_memput_lsync(self.addr.addr, from_addr, size, rsync_addr)
-        elif sync == 'async':
-            lib.hpx_gas_memput(self.addr.addr, from_addr, size, lsync_addr, rsync_addr)
-        else:
-            ValueError("'sync' argument can only be 'rsync', 'lsync' or 'async'")
+            if sync == 'rsync':
+                lib.hpx_gas_memput_rsync(self.addr.addr, from_addr, size)
+            elif sync == 'lsync':
+                lib.hpx_gas_memput_lsync(self.addr.addr, from_addr, size, rsync_addr)
+            elif sync == 'async':
+                lib.hpx_gas_memput(self.addr.addr, from_addr, size, lsync_addr, rsync_addr)
+            else:
+                raise ValueError("'sync' argument can only be 'rsync', 'lsync' or 'async'")
+            return
+
+        addrs = AddressArray.from_offsets(self.addr, offsets)
+        addrs.set(from_array.reshape((len(addrs), -1)), sync=sync, lsync_lco=lsync_lco,
+                  rsync_lco=rsync_lco)
+
+    def copy_to(self, dst, sync='sync', rsync_lco=None):
+        """ Copy this block into another global block.
+
+        The data moves between the localities owning the two blocks without going 
+        through the caller. If the blocks are not continuous, the copy is decomposed 
+        into contiguous runs which are copied concurrently.
+
+        Args:
+            dst (GlobalAddressBlock): The destination block, which must have the same 
+                shape and data type as this block.
+            sync (string): can be 'sync' or 'async'.
+            rsync_lco (LCO): An LCO object to be set when the copy is completed. This is
+                only meaningful when `sync` is 'async'.
+        """
+        if not isinstance(dst, GlobalAddressBlock):
+            raise TypeError("dst argument must be a GlobalAddressBlock")
+        if dst.shape != self.shape or dst.dtype != self.dtype:
+            raise RuntimeError("dst argument must match the shape and data type of the block")
+        src_offsets, dst_offsets, run_size = _paired_runs(self.shape, self.strides, 
+                                                          dst.strides, self.dtype.itemsize)
+        _copy_runs(self.addr, dst.addr, src_offsets, dst_offsets, run_size, sync, rsync_lco)
         
 # }}}
 
@@ -932,6 +2006,20 @@ def _calculate_block_size(shape):
         total_size *= dim
     return total_size
 
+@create_action(pinned=True)
+def _read_block_from_file(local, path, offset):
+    local[...] = np.memmap(path, dtype=local.dtype, mode='r', offset=offset, 
+                           shape=local.shape)
+    return SUCCESS
+
+@create_action(pinned=True)
+def _write_block_to_file(local, path, offset):
+    mapped = np.memmap(path, dtype=local.dtype, mode='r+', offset=offset, shape=local.shape)
+    mapped[...] = local
+    mapped.flush()
+    del mapped
+    return SUCCESS
+
 class GlobalMemory:
 
     def __init__(self, addr, numBlock, blockShape, dtype, strides):
@@ -964,6 +2052,25 @@ class GlobalMemory:
             strides.appendleft(strides[0] * shape[i])
         return tuple(strides)
 
+    @classmethod
+    def _allocate(cls, c_alloc, numBlock, blockShape, dtype, *c_args):
+        """ This is used internally for GAS allocation implementation.
+
+        Args:
+            c_alloc: The HPX allocation function, which is called with the number of 
+                blocks, the block size in bytes and `c_args`.
+        """
+        if isinstance(numBlock, int):
+            numBlock = (numBlock,)
+        if isinstance(blockShape, int):
+            blockShape = (blockShape,)
+
+        block_size = _calculate_block_size(blockShape) * dtype.itemsize
+        block_num = _calculate_block_size(numBlock)
+        addr = c_alloc(block_num, block_size, *c_args)
+        strides = GlobalMemory._calculate_strides(numBlock + blockShape, dtype)
+        return cls(GlobalAddress(addr, block_size), numBlock, blockShape, dtype, strides)
+
     @classmethod
     def alloc_cyclic(cls, numBlock, blockShape, dtype, boundary=0):
         """Allocate cyclically distributed global memory.
@@ -977,31 +2084,70 @@ class GlobalMemory:
         Returns:
             A GlobalMemory object representing the allocated memory.
         """
-        if isinstance(numBlock, int):
-            numBlock = (numBlock,)
-        if isinstance(blockShape, int):
-            blockShape = (blockShape,)
+        return cls._allocate(lib.hpx_gas_alloc_cyclic, numBlock, blockShape, dtype, boundary)
 
-        block_size = _calculate_block_size(blockShape) * dtype.itemsize
-        block_num = _calculate_block_size(numBlock)
-        addr = lib.hpx_gas_alloc_cyclic(block_num, block_size, boundary)
-        strides = GlobalMemory._calculate_strides(numBlock + blockShape, dtype)
-        return cls(GlobalAddress(addr, block_size), numBlock, blockShape, dtype, strides)
+    @classmethod
+    def calloc_cyclic(cls, numBlock, blockShape, dtype, boundary=0):
+        """Allocate cyclically distributed global zeroed memory.
+        """
+        return cls._allocate(lib.hpx_gas_calloc_cyclic, numBlock, blockShape, dtype, boundary)
+
+    @classmethod
+    def alloc_blocked(cls, numBlock, blockShape, dtype, boundary=0):
+        """Allocate global memory distributed in contiguous chunks of blocks.
+
+        The blocks are divided into one chunk per locality, so that consecutive 
+        blocks are on the same locality. The arguments are the same as 
+        `GlobalMemory.alloc_cyclic`.
+        """
+        return cls._allocate(lib.hpx_gas_alloc_blocked, numBlock, blockShape, dtype, boundary)
+
+    @classmethod
+    def calloc_blocked(cls, numBlock, blockShape, dtype, boundary=0):
+        """Allocate global zeroed memory distributed in contiguous chunks of blocks.
+        """
+        return cls._allocate(lib.hpx_gas_calloc_blocked, numBlock, blockShape, dtype, boundary)
+
+    @classmethod
+    def alloc_user(cls, numBlock, blockShape, dtype, dist, boundary=0, zeroed=False):
+        """Allocate global memory with a user-defined distribution.
+
+        Args:
+            numBlock (tuple, int): The number of blocks to allocate.
+            blockShape (tuple, int): The shape of each block.
+            dtype (numpy.dtype): The data type of each entry in the block.
+            dist (function): A function which takes the linear index of a block and 
+                the total number of blocks, and returns the rank of the locality 
+                where the block is allocated.
+            boundary (int): The alignment.
+            zeroed (bool): Whether the allocated memory is initialized to zero.
+
+        Returns:
+            A GlobalMemory object representing the allocated memory.
 
-    @classmethod
-    def calloc_cyclic(cls, numBlock, blockShape, dtype, boundary=0):
-        """Allocate cyclically distributed global zeroed memory.
+        Raises:
+            ValueError: If `dist` returns a rank outside `[0, hpx.get_num_ranks())`.
         """
+        # exceptions cannot propagate through the C callback, so the ranks are
+        # computed and checked before the allocation
         if isinstance(numBlock, int):
             numBlock = (numBlock,)
-        if isinstance(blockShape, int):
-            blockShape = (blockShape,)
-
-        block_size = _calculate_block_size(blockShape) * dtype.itemsize
-        block_num = _calculate_block_size(numBlock)
-        addr = lib.hpx_gas_calloc_cyclic(block_num, block_size, boundary)
-        strides = GlobalMemory._calculate_strides(numBlock + blockShape, dtype)
-        return cls(GlobalAddress(addr, block_size), numBlock, blockShape, dtype, strides)
+        num_blocks = _calculate_block_size(numBlock)
+        num_ranks = get_num_ranks()
+        ranks = [dist(i, num_blocks) for i in range(num_blocks)]
+        for i, rank in enumerate(ranks):
+            if not isinstance(rank, (int, np.integer)) or rank < 0 or rank >= num_ranks:
+                raise ValueError("distribution returned invalid rank {0!r} for block {1}"
+                                 .format(rank, i))
+
+        def dist_func(i, n, bsize):
+            return lib.HPX_THERE(int(ranks[i]))
+
+        # the callback is only invoked during the allocation call
+        c_dist = ffi.callback("hpx_gas_dist_t", dist_func)
+        c_alloc = lib.hpx_gas_calloc if zeroed else lib.hpx_gas_alloc
+        return cls._allocate(c_alloc, numBlock, blockShape, dtype, boundary, c_dist,
+                             lib.HPX_GAS_ATTR_NONE)
 
     @classmethod
     def alloc_local_at(cls, numBlock, blockShape, dtype, loc, boundary=0, sync='sync', 
@@ -1018,8 +2164,30 @@ class GlobalMemory:
         Args:
             loc (GlobalAddress or int): The address which the allocation targets.
             sync (string): this argument can be either 'sync' or 'async'. If this argument is 
-                'async', an optional argument `lco` can be provided for synchronization.
+                'async', the call returns immediately with a GlobalMemoryFuture, and an 
+                optional Future LCO `lco` can be provided to receive the allocated 
+                address.
+
+        Returns:
+            A GlobalMemory object if `sync` is 'sync', otherwise a GlobalMemoryFuture 
+            object which resolves to the GlobalMemory object.
+        """
+        return cls._allocate_local_at(lib.hpx_gas_alloc_local_at_sync, 
+                                      lib.hpx_gas_alloc_local_at_async, numBlock, 
+                                      blockShape, dtype, loc, boundary, sync, lco)
+
+    @classmethod
+    def calloc_local_at(cls, numBlock, blockShape, dtype, loc, boundary=0, sync='sync', 
+        lco=None):
+        """Allocate a block of global zeroed memory. See `GlobalMemory.alloc_local_at`.
         """
+        return cls._allocate_local_at(lib.hpx_gas_calloc_local_at_sync, 
+                                      lib.hpx_gas_calloc_local_at_async, numBlock, 
+                                      blockShape, dtype, loc, boundary, sync, lco)
+
+    @classmethod
+    def _allocate_local_at(cls, c_alloc_sync, c_alloc_async, numBlock, blockShape, dtype, 
+        loc, boundary, sync, lco):
         if isinstance(numBlock, int):
             numBlock = (numBlock,)
         if isinstance(blockShape, int):
@@ -1035,16 +2203,17 @@ class GlobalMemory:
         block_num = _calculate_block_size(numBlock)
 
         if sync == 'sync':
-            addr = lib.hpx_gas_alloc_local_at_sync(block_num, block_size, boundary, loc_addr)
+            addr = c_alloc_sync(block_num, block_size, boundary, loc_addr)
         elif sync == 'async':
-            if isinstance(lco, LCO):
-                lco_addr = lco.addr
-            elif lco is None:
-                lco_addr = NULL()
-            else:
+            owns_lco = lco is None
+            if owns_lco:
+                lco = Future((1,), np.dtype(np.uint64))
+            elif not isinstance(lco, Future):
                 raise RuntimeError("Unrecognizable argument 'lco'")
 
-            addr = lib.hpx_gas_alloc_local_at_async(block_num, block_size, boundary, loc_addr, lco_addr)
+            c_alloc_async(block_num, block_size, boundary, loc_addr, lco.addr)
+            return GlobalMemoryFuture(lco, owns_lco, cls, block_size, numBlock, blockShape, 
+                                      dtype, strides)
         else:
             raise RuntimeError("Unrecognizable argument 'sync'")
 
@@ -1062,6 +2231,198 @@ class GlobalMemory:
     def free_sync(self):
         lib.hpx_gas_free_sync(self.addr.addr)
 
+    def _runs(self):
+        """ Decompose this object into contiguous runs which never cross a block.
+
+        Returns:
+            A tuple of an AddressArray of the start of every run in C order and the
+            size in bytes of every run.
+        """
+        block_dims = len(self.numBlock)
+        block_offsets = _index_offsets(self.numBlock, self.strides[:block_dims])
+        run_offsets, run_size = _contiguous_runs(self.blockShape, self.strides[block_dims:],
+                                                 self.dtype.itemsize)
+        offsets = (block_offsets[:, np.newaxis] + run_offsets[np.newaxis, :]).reshape(-1)
+        return AddressArray.from_offsets(self.addr, offsets), run_size
+
+    def get(self, sync='sync', lsync_lco=None, out_array=None):
+        """ Copy all blocks of this object into one local numpy array.
+
+        The copies of all blocks are issued concurrently, one for every contiguous
+        run of a block, and complete on one LCO.
+
+        Args:
+            sync (string): can be 'sync' or 'async'. See `GlobalAddressBlock.get`.
+            lsync_lco (LCO): An LCO object to be set when all data has arrived. This 
+                is only meaningful when `sync` is 'async'. If it is None, a new 
+                Future is created.
+            out_array (numpy.ndarray): An optional C contiguous numpy array of shape
+                `numBlock + blockShape` to copy into.
+
+        Returns:
+            A numpy array of shape `numBlock + blockShape` if `sync` is 'sync'. A 
+            tuple of this array and the LCO signaling its arrival if `sync` is 
+            'async'.
+        """
+        shape = self.numBlock + self.blockShape
+        if out_array is None:
+            out_array = np.empty(shape, dtype=self.dtype)
+        elif not out_array.flags['C_CONTIGUOUS'] or out_array.nbytes != \
+                _calculate_block_size(shape) * self.dtype.itemsize:
+            raise RuntimeError("out_array argument must be C contiguous and match the memory size")
+
+        if sync not in ('sync', 'async'):
+            raise ValueError("'sync' argument needs to be either 'sync' or 'async'")
+        if sync == 'sync' or lsync_lco is None:
+            get_lco = Future()
+        else:
+            get_lco = lsync_lco
+
+        addrs, run_size = self._runs()
+        sizes = np.full(addrs.addrs.shape, run_size, dtype=np.uintp)
+        rtv = lib.pyhpx_gas_memget_v(_get_array_pointer(out_array),
+                                     _get_array_pointer(addrs.addrs, "hpx_addr_t *"),
+                                     _get_array_pointer(sizes, "size_t *"), len(addrs),
+                                     get_lco.addr)
+        if rtv != SUCCESS:
+            raise HPXError("memget failed")
+
+        if sync == 'sync':
+            get_lco.wait()
+            get_lco.delete()
+            return out_array
+        return out_array, get_lco
+
+    def set(self, from_array, sync='rsync', lsync_lco=None, rsync_lco=None):
+        """ Scatter a local numpy array into all blocks of this object.
+
+        The copies into all blocks are issued concurrently, one for every contiguous
+        run of a block. The LCOs are set once when all copies are completed.
+
+        Args:
+            from_array (numpy.ndarray): A C contiguous numpy array with as many bytes
+                as this object, usually of shape `numBlock + blockShape`.
+            sync (string): This argument can be 'async', 'lsync', 'rsync'. See 
+                `GlobalAddressBlock.set` for details.
+            lsync_lco (LCO): An LCO object to be set when `from_array` can be reused.
+            rsync_lco (LCO): An LCO object to be set when all copies are completed.
+        """
+        if not from_array.flags['C_CONTIGUOUS']:
+            raise RuntimeError("from_array argument must be C contiguous")
+        shape = self.numBlock + self.blockShape
+        if from_array.nbytes != _calculate_block_size(shape) * self.dtype.itemsize:
+            raise RuntimeError("from_array argument must match the memory size")
+        addrs, run_size = self._runs()
+        addrs.set(from_array.reshape((len(addrs), -1)), sync=sync, lsync_lco=lsync_lco,
+                  rsync_lco=rsync_lco)
+
+    def copy_to(self, dst, sync='sync', rsync_lco=None):
+        """ Copy all blocks of this object into another GlobalMemory object.
+
+        Every block is copied directly between the owning localities, one copy for 
+        every contiguous run, and all copies complete on one LCO.
+
+        Args:
+            dst (GlobalMemory): The destination, which must have the same `numBlock`, 
+                `blockShape` and data type as this object.
+            sync (string): can be 'sync' or 'async'.
+            rsync_lco (LCO): An LCO object to be set when all copies are completed. This
+                is only meaningful when `sync` is 'async'.
+        """
+        if not isinstance(dst, GlobalMemory):
+            raise TypeError("dst argument must be a GlobalMemory")
+        if (dst.numBlock != self.numBlock or dst.blockShape != self.blockShape or 
+                dst.dtype != self.dtype):
+            raise RuntimeError("dst argument must match the layout and data type of the memory")
+        block_dims = len(self.numBlock)
+        src_blocks = _index_offsets(self.numBlock, self.strides[:block_dims])
+        dst_blocks = _index_offsets(dst.numBlock, dst.strides[:block_dims])
+        src_runs, dst_runs, run_size = _paired_runs(self.blockShape, self.strides[block_dims:],
+                                                    dst.strides[block_dims:], 
+                                                    self.dtype.itemsize)
+        src_offsets = (src_blocks[:, np.newaxis] + src_runs[np.newaxis, :]).reshape(-1)
+        dst_offsets = (dst_blocks[:, np.newaxis] + dst_runs[np.newaxis, :]).reshape(-1)
+        _copy_runs(self.addr, dst.addr, src_offsets, dst_offsets, run_size, sync, rsync_lco)
+
+    @classmethod
+    def from_file(cls, path, dtype, blockShape, distribution='cyclic', offset=0):
+        """ Load a binary file into newly allocated global memory.
+
+        The file holds the blocks in C order, without a header after `offset`. 
+        Every owning locality memory-maps the part of the file of its blocks and 
+        copies it into the pinned blocks, so all blocks are read in parallel. The 
+        file must be readable at the same path on every locality, e.g. on a shared
+        file system.
+
+        Args:
+            path (string): The path of the file.
+            dtype (numpy.dtype): The data type of each entry in the block.
+            blockShape (tuple, int): The shape of each block. The size of the file 
+                after `offset` must be a multiple of the size of a block.
+            distribution: 'cyclic', 'blocked', or a function mapping a block index 
+                and the number of blocks to a rank as in `GlobalMemory.alloc_user`.
+            offset (int): The number of bytes to skip at the beginning of the file.
+
+        Returns:
+            A GlobalMemory object with one block dimension.
+        """
+        dtype = np.dtype(dtype)
+        if isinstance(blockShape, int):
+            blockShape = (blockShape,)
+        block_bytes = _calculate_block_size(blockShape) * dtype.itemsize
+        data_bytes = os.path.getsize(path) - offset
+        if data_bytes <= 0 or data_bytes % block_bytes != 0:
+            raise ValueError("file size must be a positive multiple of the block size")
+        numBlock = data_bytes // block_bytes
+
+        if distribution == 'cyclic':
+            memory = cls.alloc_cyclic(numBlock, blockShape, dtype)
+        elif distribution == 'blocked':
+            memory = cls.alloc_blocked(numBlock, blockShape, dtype)
+        elif callable(distribution):
+            memory = cls.alloc_user(numBlock, blockShape, dtype, distribution)
+        else:
+            raise ValueError("'distribution' must be 'cyclic', 'blocked' or a function")
+
+        done = And(numBlock)
+        for i, block in enumerate(memory.blocks()):
+            _read_block_from_file(block, path, offset + i * block_bytes, rsync_lco=done)
+        done.wait()
+        done.delete()
+        return memory
+
+    def to_file(self, path, offset=0):
+        """ Write all blocks of this object to a binary file in C order.
+
+        The file is created or resized by the caller, then every owning locality 
+        memory-maps the part of the file of its blocks and writes them in 
+        parallel. See `GlobalMemory.from_file` for the file layout.
+
+        Args:
+            path (string): The path of the file.
+            offset (int): The number of bytes before the first block, which are 
+                left unchanged if the file exists.
+        """
+        block_bytes = _calculate_block_size(self.blockShape) * self.dtype.itemsize
+        num_blocks = _calculate_block_size(self.numBlock)
+        with open(path, 'ab') as f:
+            f.truncate(offset + num_blocks * block_bytes)
+
+        done = And(num_blocks)
+        for i, block in enumerate(self.blocks()):
+            _write_block_to_file(block, path, offset + i * block_bytes, rsync_lco=done)
+        done.wait()
+        done.delete()
+
+    def blocks(self):
+        """ Iterate over the blocks of this object in C order.
+
+        Yields:
+            A GlobalAddressBlock object for each block.
+        """
+        for index in np.ndindex(*self.numBlock):
+            yield self[index]
+
     def __getitem__(self, key):
 
         block_dims = len(self.numBlock)
@@ -1078,7 +2439,7 @@ class GlobalMemory:
         newNumBlock = []
         newBlockShape = []
         newStrides = []
-        newAddr = copy.copy(self.addr)
+        offset = 0
 
         for i in range(len(keyWrap)):
             if i >= len(self.strides):
@@ -1087,12 +2448,12 @@ class GlobalMemory:
             if isinstance(keyWrap[i], int):
                 if keyWrap[i] >= dims[i] or keyWrap[i] < 0:
                     raise RuntimeError("GlobalMemory object index out of bound")
-                newAddr += keyWrap[i]*self.strides[i]
+                offset += keyWrap[i]*self.strides[i]
             elif isinstance(keyWrap[i], slice):
                 start, stop = _currentdim_is_slice(keyWrap[i], dims[i])
                 if start >= dims[i] or start < 0 or stop > dims[i] or stop < 0:
                     raise RuntimeError("GlobalMemory object index out of bound")
-                newAddr += start*self.strides[i]
+                offset += start*self.strides[i]
                 newStrides.append(self.strides[i])
                 if i < block_dims:
                     newNumBlock.append(stop - start)
@@ -1117,12 +2478,58 @@ class GlobalMemory:
         if len(newBlockShape) == 0:
             newBlockShape = (1,)
 
+        # the displacement of the whole index expression is applied at once
+        newAddr = self.addr + offset
         if len(newNumBlock) > 0:
             return GlobalMemory(newAddr, newNumBlock, newBlockShape, self.dtype, newStrides)
         else:
             return GlobalAddressBlock(newAddr, newBlockShape, self.dtype, newStrides)
 
 
+class GlobalMemoryFuture:
+
+    def __init__(self, lco, owns_lco, memory_class, block_size, numBlock, blockShape, dtype, 
+                 strides):
+        """ Constructor for a GlobalMemoryFuture object.
+
+        This is supposed to be used internally. It is returned by asynchronous 
+        allocations, and the `lco` is set to the allocated address by the runtime.
+
+        Args:
+            lco (Future): The Future LCO to receive the allocated address.
+            owns_lco (bool): Whether `lco` is deleted once the address is retrieved.
+        """
+        self.lco = lco
+        self._owns_lco = owns_lco
+        self._memory = None
+        self._memory_class = memory_class
+        self._block_size = block_size
+        self._layout = (numBlock, blockShape, dtype, strides)
+
+    def wait(self):
+        """ Wait until the allocation is complete.
+        """
+        if self._memory is None:
+            self.lco.wait()
+
+    def get(self):
+        """ Wait until the allocation is complete and return the allocated memory.
+
+        Returns:
+            The GlobalMemory object representing the allocated memory.
+        """
+        if self._memory is None:
+            addr = ffi.new("hpx_addr_t *")
+            rtv = lib.hpx_lco_get(self.lco.addr, ffi.sizeof("hpx_addr_t"), addr)
+            if rtv != SUCCESS:
+                raise HPXError("asynchronous allocation failed")
+            self._memory = self._memory_class(GlobalAddress(addr[0], self._block_size), 
+                                              *self._layout)
+            if self._owns_lco:
+                self.lco.delete()
+            self.lco = None
+        return self._memory
+
 # }}}
 
 # get numpy type for a user-specified C type
@@ -1147,6 +2554,14 @@ def _get_lco_addr(lco_obj):
             addr = lco_obj.addr
     return addr
 
+def _wrap_lco(addr, shape=None, dtype=None):
+    """
+    Helper function to wrap the address of an existing LCO into an LCO object.
+    """
+    lco = Future.__new__(Future)
+    LCO.__init__(lco, addr, shape, dtype)
+    return lco
+
 class LCO(metaclass=ABCMeta):
 
     @abstractmethod
@@ -1213,6 +2628,11 @@ class LCO(metaclass=ABCMeta):
     def wait(self):
         lib.hpx_lco_wait(self.addr)
 
+    def reset(self):
+        """ Reset this LCO to its initial state, so it can be set again.
+        """
+        lib.hpx_lco_reset_sync(self.addr)
+
     def get(self):
         """
         TODO: error handling
@@ -1274,7 +2694,8 @@ def create_id_action(dtype, shape=None):
         Action must be created before hpx.init().    
     """
     def decorator(python_func):
-        @create_function(argument_types=[Type.POINTER, Type.SIZE_T])
+        key = (python_func.__module__ + ":" + python_func.__name__).encode('ascii')
+        @create_function(argument_types=[Type.POINTER, Type.SIZE_T], key=key)
         def callback_action(pointer, size):
             logging.debug("rank {0} thread {1} start id callback {2}".format(
                          get_my_rank(), get_my_thread_id(),
@@ -1311,7 +2732,8 @@ def create_op_action(dtype, shape=None):
         Action must be created before hpx.init().  
     """
     def decorator(python_func):
-        @create_function(argument_types=[Type.POINTER, Type.POINTER, Type.SIZE_T])
+        key = (python_func.__module__ + ":" + python_func.__name__).encode('ascii')
+        @create_function(argument_types=[Type.POINTER, Type.POINTER, Type.SIZE_T], key=key)
         def callback_action(lhs, rhs, size):
             logging.debug("rank {0} thread {1} start op callback {2}".format(
                          get_my_rank(), get_my_thread_id(),
@@ -1342,6 +2764,950 @@ class Reduce(LCO):
         super(Reduce, self).__init__(addr, shape, dtype) 
 # }}}
 
+# {{{ DistArray
+
+_distarray_ufuncs = {'sum': np.add, 'min': np.minimum, 'max': np.maximum}
+_distarray_reductions = {}
+
+def _register_distarray_reduction(op, dtype):
+    """ Register the initialization and reduction actions of a DistArray reduction.
+    """
+    ufunc = _distarray_ufuncs[op]
+    if op == 'sum':
+        identity = 0
+    elif np.issubdtype(dtype, np.floating):
+        identity = np.inf if op == 'min' else -np.inf
+    else:
+        identity = np.iinfo(dtype).max if op == 'min' else np.iinfo(dtype).min
+
+    def reduction_id(array):
+        array[:] = identity
+
+    def reduction_op(lhs, rhs):
+        lhs[:] = ufunc(lhs, rhs)
+
+    name = "_distarray_{0}_{1}".format(op, dtype.name)
+    reduction_id.__name__ = name + "_id"
+    reduction_op.__name__ = name + "_op"
+    _distarray_reductions[(op, dtype)] = (create_id_action(dtype)(reduction_id),
+                                          create_op_action(dtype)(reduction_op))
+
+for _op in _distarray_ufuncs:
+    for _dtype in (np.dtype(np.float64), np.dtype(np.int64)):
+        _register_distarray_reduction(_op, _dtype)
+
+def _pin_or_get(block, stack):
+    """ Pin `block` for the scope of `stack` if it is local, otherwise copy it.
+    """
+    try:
+        return stack.enter_context(block.pinned())
+    except HPXError:
+        return block.get()
+
+@create_action(pinned=True)
+def _distarray_map(out_local, ufunc, operands, rows):
+    with ExitStack() as stack:
+        arrays = [_pin_or_get(operand, stack)[:rows] if isinstance(operand, GlobalAddressBlock)
+                  else operand for operand in operands]
+        ufunc(*arrays, out=out_local[:rows])
+    return SUCCESS
+
+@create_action(pinned=True)
+def _distarray_reduce(local, op, rows, dtype, reduce_lco):
+    partial = _distarray_ufuncs[op].reduce(local[:rows], axis=None)
+    reduce_lco.set(np.array([partial], dtype=dtype), sync='lsync')
+    return SUCCESS
+
+class DistArray:
+
+    def __init__(self, memory, shape):
+        """ Constructor for a DistArray object.
+
+        This is supposed to be used internally. User should refer to one of the 
+        class methods for creating a DistArray.
+
+        Args:
+            memory (GlobalMemory): The global memory holding the blocks of this array.
+                It has one block dimension, and each block holds `blockShape[0]` rows.
+            shape (tuple): The shape of this array.
+        """
+        self.memory = memory
+        self.shape = shape
+        self.dtype = memory.dtype
+        self.block_rows = memory.blockShape[0]
+        self.num_blocks = memory.numBlock[0]
+        self._block_owners = None
+
+    @classmethod
+    def _alloc(cls, shape, dtype, block_rows, alloc_func):
+        if isinstance(shape, int):
+            shape = (shape,)
+        dtype = np.dtype(dtype)
+        if block_rows is None:
+            block_rows = max(1, -(-shape[0] // get_num_ranks()))
+        num_blocks = max(1, -(-shape[0] // block_rows))
+        memory = alloc_func(num_blocks, (block_rows,) + tuple(shape[1:]), dtype)
+        return cls(memory, tuple(shape))
+
+    @classmethod
+    def empty(cls, shape, dtype, block_rows=None):
+        """ Allocate an uninitialized DistArray.
+
+        The array is partitioned along its first dimension into blocks of 
+        `block_rows` rows, which are distributed cyclically over all localities.
+
+        Args:
+            shape (tuple, int): The shape of the array.
+            dtype (numpy.dtype): The data type of the array.
+            block_rows (int): The number of rows in each block. By default the rows 
+                are divided evenly among the localities.
+        """
+        return cls._alloc(shape, dtype, block_rows, GlobalMemory.alloc_cyclic)
+
+    @classmethod
+    def zeros(cls, shape, dtype, block_rows=None):
+        """ Allocate a DistArray filled with zeros. See `DistArray.empty`.
+        """
+        return cls._alloc(shape, dtype, block_rows, GlobalMemory.calloc_cyclic)
+
+    @classmethod
+    def from_numpy(cls, array, block_rows=None):
+        """ Create a DistArray with the content of a local numpy array.
+        """
+        array = np.ascontiguousarray(array)
+        dist_array = cls.empty(array.shape, array.dtype, block_rows)
+        full_blocks = array.shape[0] // dist_array.block_rows
+        full_rows = full_blocks * dist_array.block_rows
+        lco = And(2)
+        if full_blocks > 0:
+            dist_array.memory[:full_blocks].set(array[:full_rows], sync='lsync', rsync_lco=lco)
+        else:
+            lco.set()
+        if full_rows < array.shape[0]:
+            last_block = dist_array.memory[full_blocks][:array.shape[0] - full_rows]
+            last_block.set(array[full_rows:], sync='lsync', rsync_lco=lco)
+        else:
+            lco.set()
+        lco.wait()
+        lco.delete()
+        return dist_array
+
+    def to_numpy(self):
+        """ Copy this array into a local numpy array.
+        """
+        array = self.memory.get()
+        return array.reshape((-1,) + self.shape[1:])[:self.shape[0]]
+
+    def free(self):
+        """ Free the global memory of this array.
+        """
+        self.memory.free_sync()
+
+    @property
+    def block_owners(self):
+        """ The rank of the locality owning each block.
+        """
+        if self._block_owners is None:
+            addrs = AddressArray([block.addr.addr for block in self.memory.blocks()],
+                                 self.memory.addr.bsize)
+            self._block_owners = addrs.owners()
+        return self._block_owners
+
+    def _block_rows(self, i):
+        return min(self.block_rows, self.shape[0] - i * self.block_rows)
+
+    def __getitem__(self, key):
+        """ Copy the selected rows of this array into a local numpy array.
+
+        The first index selects rows and can be an int or a slice with step 1, only
+        the blocks holding these rows are copied. Other indices are applied to the 
+        local copy.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        row_key = key[0]
+        if isinstance(row_key, (int, np.integer)):
+            row = row_key + self.shape[0] if row_key < 0 else row_key
+            if row < 0 or row >= self.shape[0]:
+                raise RuntimeError("DistArray object index out of bound")
+            start, stop = row, row + 1
+        elif isinstance(row_key, slice):
+            if row_key.step not in (None, 1):
+                raise RuntimeError("DistArray only supports slices with step 1")
+            start, stop, _ = row_key.indices(self.shape[0])
+        else:
+            raise TypeError("Invalid key type")
+
+        if stop <= start:
+            array = np.empty((0,) + self.shape[1:], dtype=self.dtype)
+        else:
+            first_block = start // self.block_rows
+            last_block = (stop - 1) // self.block_rows
+            array = self.memory[first_block:last_block+1].get()
+            array = array.reshape((-1,) + self.shape[1:])
+            offset = first_block * self.block_rows
+            array = array[start-offset:stop-offset]
+
+        if isinstance(row_key, (int, np.integer)):
+            array = array[0]
+        return array[key[1:]] if len(key) > 1 else array
+
+    def map(self, ufunc, *operands, out=None):
+        """ Apply an elementwise numpy ufunc where the blocks are owned.
+
+        Each block of the result is computed by an action on the locality owning
+        it. Operands which are DistArrays with the same partition are pinned 
+        there, so block-aligned operations move no data.
+
+        Args:
+            ufunc (numpy.ufunc): The ufunc to apply to this array and `operands`.
+            *operands: Additional operands, either DistArrays with the same shape 
+                and partition as this array, or scalars.
+            out (DistArray): An optional array to store the result in.
+
+        Returns:
+            The DistArray holding the result.
+        """
+        operands = (self,) + operands
+        for operand in operands:
+            if isinstance(operand, DistArray) and (operand.shape != self.shape or 
+                                                   operand.block_rows != self.block_rows):
+                raise ValueError("DistArray operands must have the same shape and partition")
+        samples = [np.zeros(1, dtype=operand.dtype) if isinstance(operand, DistArray)
+                   else operand for operand in operands]
+        dtype = ufunc(*samples).dtype
+        if out is None:
+            out = DistArray.empty(self.shape, dtype, self.block_rows)
+        elif (out.shape != self.shape or out.block_rows != self.block_rows or
+              out.dtype != dtype):
+            raise ValueError("'out' must have the shape, partition and result data type "
+                             "of the operation")
+
+        done = And(self.num_blocks)
+        for i, out_block in enumerate(out.memory.blocks()):
+            block_operands = [operand.memory[i] if isinstance(operand, DistArray) 
+                              else operand for operand in operands]
+            _distarray_map(out_block, ufunc, block_operands, self._block_rows(i),
+                           rsync_lco=done)
+        done.wait()
+        done.delete()
+        return out
+
+    def __add__(self, other):
+        return self.map(np.add, other)
+
+    def __radd__(self, other):
+        return self.map(np.add, other)
+
+    def __sub__(self, other):
+        return self.map(np.subtract, other)
+
+    def __mul__(self, other):
+        return self.map(np.multiply, other)
+
+    def __rmul__(self, other):
+        return self.map(np.multiply, other)
+
+    def __truediv__(self, other):
+        return self.map(np.true_divide, other)
+
+    def _reduce(self, op):
+        if np.issubdtype(self.dtype, np.floating):
+            dtype = np.dtype(np.float64)
+        elif np.issubdtype(self.dtype, np.integer) or self.dtype == np.bool_:
+            dtype = np.dtype(np.int64)
+        else:
+            raise TypeError("DistArray reductions only support numeric data types")
+        # blocks past the last row hold no elements to reduce
+        blocks = [(block, self._block_rows(i)) for i, block in enumerate(self.memory.blocks())
+                  if self._block_rows(i) > 0]
+        if len(blocks) == 0:
+            if op == 'sum':
+                return dtype.type(0)
+            raise ValueError("zero-size DistArray has no {0}".format(op))
+        id_action, op_action = _distarray_reductions[(op, dtype)]
+        reduce_lco = Reduce(len(blocks), (1,), dtype, id_action, op_action)
+        for block, rows in blocks:
+            _distarray_reduce(block, op, rows, dtype, reduce_lco)
+        result = reduce_lco.get()[0]
+        reduce_lco.delete()
+        return result
+
+    def sum(self):
+        """ Sum of all elements, computed with a Reduce LCO over the blocks.
+        """
+        return self._reduce('sum')
+
+    def min(self):
+        """ Minimum of all elements, computed with a Reduce LCO over the blocks.
+        """
+        return self._reduce('min')
+
+    def max(self):
+        """ Maximum of all elements, computed with a Reduce LCO over the blocks.
+        """
+        return self._reduce('max')
+
+# }}}
+
+# {{{ Halo exchange
+
+def _halo_slab(block, axis, start, stop, width, block_dims):
+    """ Helper function for the slab `start:stop` of `block` along `axis`.
+
+    The slab excludes the ghost regions of the other partitioned dimensions, so 
+    corners are not exchanged.
+    """
+    key = [slice(None)] * len(block.shape)
+    for i in range(block_dims):
+        if i != axis:
+            key[i] = slice(width, block.shape[i] - width)
+    key[axis] = slice(start, stop)
+    return block[tuple(key)]
+
+def halo_exchange(memory, width, periodic=False):
+    """ Fill the ghost regions of a block-partitioned GlobalMemory from its neighbors.
+
+    Each of the one or two block dimensions of `memory` partitions the 
+    corresponding leading dimension of `blockShape`. Every block stores its 
+    interior with a ghost region of `width` on both sides of each partitioned 
+    dimension, for example a block shape of `(n + 2*width,)` for `n` interior 
+    rows. The boundary slabs of the interior are copied into the ghost regions 
+    of the neighboring blocks directly between the owning localities. The corners 
+    of two dimensional blocks are not exchanged.
+
+    Args:
+        memory (GlobalMemory): The memory with one or two block dimensions.
+        width (int): The width of the ghost regions.
+        periodic (bool): Whether the first and last blocks of a dimension are 
+            neighbors.
+
+    Returns:
+        An LCO which is set when all copies are completed, so computation on the 
+        interior can overlap the exchange. The caller should delete it after use.
+    """
+    block_dims = len(memory.numBlock)
+    if block_dims not in (1, 2) or len(memory.blockShape) < block_dims:
+        raise ValueError("halo_exchange supports one or two block dimensions")
+    for axis in range(block_dims):
+        if memory.blockShape[axis] < 3 * width:
+            raise ValueError("block shape is too small for the halo width")
+
+    copies = []
+    for axis in range(block_dims):
+        n = memory.blockShape[axis]
+        for index in np.ndindex(*memory.numBlock):
+            neighbor = list(index)
+            neighbor[axis] += 1
+            if neighbor[axis] == memory.numBlock[axis]:
+                if not periodic:
+                    continue
+                neighbor[axis] = 0
+            lower = memory[index]
+            upper = memory[tuple(neighbor)]
+            copies.append((_halo_slab(lower, axis, n - 2*width, n - width, width, block_dims),
+                           _halo_slab(upper, axis, 0, width, width, block_dims)))
+            copies.append((_halo_slab(upper, axis, width, 2*width, width, block_dims),
+                           _halo_slab(lower, axis, n - width, n, width, block_dims)))
+
+    done = And(max(len(copies), 1))
+    if len(copies) == 0:
+        done.set()
+    for src, dst in copies:
+        src.copy_to(dst, sync='async', rsync_lco=done)
+    return done
+
+# }}}
+
+# {{{ Checkpoint
+
+_CHECKPOINT_MANIFEST = 'manifest.json'
+
+def _checkpoint_file(rank):
+    """ Helper function for the name of the data file written by `rank`.
+    """
+    return 'rank{0}.npz'.format(rank)
+
+def _checkpoint_key(name, index):
+    """ Helper function for the key of a block in a data file.
+    """
+    return '{0}/{1}'.format(name, index)
+
+def _descr_from_json(descr):
+    """ Helper function to turn a dtype description read from JSON back into 
+    the form accepted by `numpy.lib.format.descr_to_dtype`.
+    """
+    if isinstance(descr, str):
+        return descr
+    fields = []
+    for field in descr:
+        entry = [field[0], _descr_from_json(field[1])]
+        if len(field) > 2:
+            entry.append(tuple(field[2]))
+        fields.append(tuple(entry))
+    return fields
+
+@create_action()
+def _checkpoint_write(path, rank, blocks):
+    with PinCache():
+        arrays = {key: block.try_pin() for key, block in blocks}
+        np.savez(os.path.join(path, _checkpoint_file(rank)), **arrays)
+    return SUCCESS
+
+@create_action()
+def _checkpoint_notify(done, lco):
+    done.delete()
+    lco.set()
+    return SUCCESS
+
+@create_action()
+def _checkpoint_read(path, rank, blocks):
+    with np.load(os.path.join(path, _checkpoint_file(rank))) as data:
+        for key, block in blocks:
+            with block.pinned() as local:
+                local[...] = data[key]
+    return SUCCESS
+
+def checkpoint(path, objects, sync='sync', lco=None):
+    """ Write named GlobalMemory objects to a checkpoint directory.
+
+    Every locality owning blocks of `objects` writes them in one file 
+    `rank<r>.npz` in `path`, and all localities write concurrently. The caller 
+    writes a small manifest with the shape, data type and block owners of each 
+    object, which `restore` uses to allocate the objects again. The directory must 
+    be visible at the same path on every locality, e.g. on a shared file system.
+
+    Args:
+        path (string): The checkpoint directory, which is created if it does not 
+            exist.
+        objects (dict): A dictionary mapping names to GlobalMemory objects.
+        sync (string): 'sync' to wait for all files to be written, 'async' to 
+            return immediately. The objects must not be modified before the 
+            writes are completed.
+        lco (LCO): The LCO to set once when all files are written if `sync` is 
+            'async'. If None, a new LCO is created. A given LCO is never deleted 
+            by this function.
+
+    Returns:
+        None if `sync` is 'sync', or the LCO set when the checkpoint is completed 
+        if `sync` is 'async'. The caller should delete the LCO after use.
+    """
+    if sync not in ('sync', 'async'):
+        raise ValueError("'sync' argument must be either 'sync' or 'async'")
+    os.makedirs(path, exist_ok=True)
+
+    manifest = {'num_ranks': get_num_ranks(), 'objects': {}}
+    per_rank = {}
+    for name, memory in objects.items():
+        blocks = list(memory.blocks())
+        owners = AddressArray([block.addr.addr for block in blocks]).owners()
+        for i, (block, owner) in enumerate(zip(blocks, owners)):
+            per_rank.setdefault(int(owner), []).append((_checkpoint_key(name, i), block))
+        manifest['objects'][name] = {
+            'numBlock': list(memory.numBlock),
+            'blockShape': list(memory.blockShape),
+            'dtype': np.lib.format.dtype_to_descr(memory.dtype),
+            'owners': [int(owner) for owner in owners],
+        }
+    with open(os.path.join(path, _CHECKPOINT_MANIFEST), 'w') as f:
+        json.dump(manifest, f)
+
+    done = And(max(len(per_rank), 1))
+    if len(per_rank) == 0:
+        done.set()
+    for rank, blocks in per_rank.items():
+        _checkpoint_write(THERE(rank), path, rank, blocks, rsync_lco=done)
+    if sync == 'async':
+        if lco is None:
+            return done
+        _checkpoint_notify(HERE(), done, lco, gate=done)
+        return lco
+    done.wait()
+    done.delete()
+
+def restore(path, names=None):
+    """ Read GlobalMemory objects from a checkpoint written by `checkpoint`.
+
+    Every object is allocated again with the same block distribution, and every 
+    owning locality reads its blocks from the file it wrote. If the program runs 
+    on fewer localities than when the checkpoint was written, the blocks of rank 
+    `r` are placed on rank `r % hpx.get_num_ranks()`.
+
+    Args:
+        path (string): The checkpoint directory.
+        names (list): The names of the objects to restore. If None, all objects 
+            in the checkpoint are restored.
+
+    Returns:
+        A dictionary mapping names to newly allocated GlobalMemory objects.
+    """
+    with open(os.path.join(path, _CHECKPOINT_MANIFEST)) as f:
+        manifest = json.load(f)
+    if names is None:
+        names = list(manifest['objects'])
+
+    num_ranks = get_num_ranks()
+    objects = {}
+    per_rank = {}
+    for name in names:
+        if name not in manifest['objects']:
+            raise KeyError("no object named {0} in the checkpoint".format(name))
+        spec = manifest['objects'][name]
+        owners = spec['owners']
+        dtype = np.lib.format.descr_to_dtype(_descr_from_json(spec['dtype']))
+        memory = GlobalMemory.alloc_user(tuple(spec['numBlock']), tuple(spec['blockShape']),
+                                         dtype,
+                                         lambda i, n, owners=owners: owners[i] % num_ranks)
+        for i, block in enumerate(memory.blocks()):
+            per_rank.setdefault(owners[i], []).append((_checkpoint_key(name, i), block))
+        objects[name] = memory
+
+    done = And(max(len(per_rank), 1))
+    if len(per_rank) == 0:
+        done.set()
+    for rank, blocks in per_rank.items():
+        _checkpoint_read(THERE(rank % num_ranks), path, rank, blocks, rsync_lco=done)
+    done.wait()
+    done.delete()
+    return objects
+
+# }}}
+
+# {{{ Pipeline
+
+# the results of running pipelines driven from this locality, keyed by chunk
+_pipeline_results = {}
+_pipeline_ids = itertools.count()
+
+@create_action()
+def _pipeline_stage(stages, i, chunk, reply_rank, reply_key, slot):
+    action, target = stages[i]
+    result = action._python_func(chunk)
+    if i + 1 < len(stages):
+        _pipeline_stage(stages[i+1][1], stages, i + 1, result, reply_rank, reply_key, slot)
+    else:
+        _pipeline_deliver(THERE(reply_rank), reply_key, result, rsync_lco=slot)
+    return SUCCESS
+
+@create_action()
+def _pipeline_deliver(reply_key, result):
+    _pipeline_results[reply_key] = result
+    return SUCCESS
+
+def _pipeline_chunks(source, chunk_rows):
+    """ Helper function for iterating over the chunks of a pipeline source.
+
+    Chunks of an array source are copied into one preallocated buffer, so a 
+    memory-mapped source is read one chunk at a time. This is safe because a 
+    launch pickles its arguments before it returns.
+    """
+    if not isinstance(source, np.ndarray):
+        for chunk in source:
+            yield chunk
+        return
+    buf = np.empty((min(chunk_rows, source.shape[0]),) + source.shape[1:], dtype=source.dtype)
+    for start in range(0, source.shape[0], chunk_rows):
+        rows = min(chunk_rows, source.shape[0] - start)
+        np.copyto(buf[:rows], source[start:start+rows])
+        yield buf[:rows]
+
+def pipeline(stages, source, depth=2, chunk_rows=1024, sink=None):
+    """ Stream the chunks of a dataset through a chain of actions.
+
+    Every chunk is passed to the Python function of the first stage, its return 
+    value to the second stage, and so on. Each stage runs on its own locality, and
+    the result of the last stage is sent back to the caller. At most `depth` chunks
+    are in flight at any time. Their completion is tracked by `depth` Futures 
+    which are reset and reused, so a dataset larger than the aggregate memory can 
+    be streamed from a memory-mapped file.
+
+    Args:
+        stages (list): The stages of the pipeline. A stage is either an Action, 
+            which runs on the current locality, or a tuple of an Action and its 
+            target (a rank or a GlobalAddress). The actions must be non-pinned 
+            marshalled actions.
+        source: A numpy array, which is split along its first dimension into chunks
+            of `chunk_rows` rows, or an iterable of chunks.
+        depth (int): The maximum number of chunks in flight.
+        chunk_rows (int): The number of rows of a chunk of an array source.
+        sink (function): A function called on the current locality with the index 
+            and result of every chunk in order. If it is None, the results are 
+            returned as a list.
+
+    Returns:
+        The list of results if `sink` is None.
+    """
+    if depth < 1:
+        raise ValueError("'depth' argument must be at least 1")
+    normalized = []
+    for stage in stages:
+        action, target = stage if isinstance(stage, tuple) else (stage, get_my_rank())
+        if action.marshalled != 'true' or action.pinned or action.vectored:
+            raise RuntimeError("pipeline stages must be non-pinned marshalled actions")
+        if isinstance(target, (int, np.integer)):
+            target = THERE(int(target))
+        normalized.append((action, target))
+    if len(normalized) == 0:
+        raise ValueError("pipeline needs at least one stage")
+
+    pipeline_id = (get_my_rank(), next(_pipeline_ids))
+    slots = [Future() for i in range(depth)]
+    in_flight = deque()
+    results = []
+
+    def retire():
+        index, slot = in_flight.popleft()
+        slot.wait()
+        result = _pipeline_results.pop((pipeline_id, index))
+        slot.reset()
+        if sink is None:
+            results.append(result)
+        else:
+            sink(index, result)
+
+    try:
+        for index, chunk in enumerate(_pipeline_chunks(source, chunk_rows)):
+            if len(in_flight) == depth:
+                retire()
+            slot = slots[index % depth]
+            _pipeline_stage(normalized[0][1], normalized, 0, chunk, get_my_rank(),
+                            (pipeline_id, index), slot)
+            in_flight.append((index, slot))
+        while len(in_flight) > 0:
+            retire()
+    finally:
+        for slot in slots:
+            slot.delete()
+
+    if sink is None:
+        return results
+
+# }}}
+
+# {{{ RPCDict
+
+# the shards of all RPCDict objects on this locality, keyed by the id of the RPCDict
+_rpc_dict_shards = {}
+# the replies of pending RPCDict.get_many calls issued from this locality
+_rpc_dict_replies = {}
+_rpc_dict_ids = itertools.count()
+
+@create_action()
+def _rpc_dict_create(dict_id):
+    _rpc_dict_shards[dict_id] = {}
+    return SUCCESS
+
+@create_action()
+def _rpc_dict_delete(dict_id):
+    _rpc_dict_shards.pop(dict_id, None)
+    return SUCCESS
+
+@create_action()
+def _rpc_dict_put(dict_id, items, version_addr):
+    _rpc_dict_shards[dict_id].update(items)
+    # the version is bumped after the update, see RPCDict.get_many
+    GlobalAddress(version_addr).fetch_add(1)
+    return SUCCESS
+
+@create_action()
+def _rpc_dict_get(dict_id, keys, version_addr, reply_rank, reply_id, reply_lco):
+    version = GlobalAddress(version_addr).fetch_add(0)
+    shard = _rpc_dict_shards[dict_id]
+    found = {key: shard[key] for key in keys if key in shard}
+    _rpc_dict_reply(THERE(reply_rank), reply_id, get_my_rank(), version, found, 
+                     rsync_lco=reply_lco)
+    return SUCCESS
+
+@create_action()
+def _rpc_dict_reply(reply_id, rank, version, found):
+    _rpc_dict_replies[reply_id].append((rank, version, found))
+    return SUCCESS
+
+class RPCDict:
+
+    def __init__(self):
+        """ Create a key-value map sharded across all localities and accessed by RPC.
+
+        Every key is owned by one locality, chosen by a hash of its pickled 
+        representation, so keys must pickle deterministically. The entries are 
+        not stored in the global address space: each locality keeps its shard in 
+        its Python heap, and every lookup or update is an action sent to the 
+        owning locality. Only an int64 version counter per locality is allocated 
+        in the global address space with `GlobalMemory.calloc_local_at`. The 
+        version is bumped by every update of the locality, so values read earlier
+        can be cached and validated with one remote atomic per locality.
+
+        This is a collective operation which creates a shard on every locality.
+        """
+        self.num_ranks = get_num_ranks()
+        self.dict_id = (get_my_rank(), next(_rpc_dict_ids))
+        self._versions = [GlobalMemory.calloc_local_at(1, 1, np.dtype(np.int64), THERE(rank))
+                          for rank in range(self.num_ranks)]
+        self.version_addrs = AddressArray([memory.addr.addr for memory in self._versions])
+        _rpc_dict_create(NULL(), self.dict_id, sync='rsync')
+        self._cache = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_cache'] = {}
+        return state
+
+    def owner(self, key):
+        """ The rank of the locality owning `key`.
+        """
+        return zlib.crc32(pickle.dumps(key)) % self.num_ranks
+
+    def _group(self, keys):
+        groups = {}
+        for key in keys:
+            groups.setdefault(self.owner(key), []).append(key)
+        return groups
+
+    def put_many(self, items, sync='rsync', rsync_lco=None):
+        """ Insert or update many entries, with one action per owning locality.
+
+        Args:
+            items (dict): The entries to insert.
+            sync (string): 'rsync' waits for the updates to complete, 'lsync' returns 
+                at once and sets `rsync_lco` once for every owning locality.
+            rsync_lco (LCO): An optional LCO for 'lsync'.
+        """
+        if sync not in ('rsync', 'lsync'):
+            raise ValueError("'sync' argument can only be 'rsync' or 'lsync'")
+        groups = self._group(items.keys())
+        if sync == 'rsync':
+            rsync_lco = And(len(groups))
+        for rank, keys in groups.items():
+            _rpc_dict_put(THERE(rank), self.dict_id, {key: items[key] for key in keys},
+                           int(self.version_addrs.addrs[rank]), rsync_lco=rsync_lco)
+        if sync == 'rsync':
+            rsync_lco.wait()
+            rsync_lco.delete()
+
+    def get_many(self, keys, default=None):
+        """ Look up many keys, with one action per owning locality.
+
+        Values cached by an earlier lookup are reused if the version of their
+        locality has not changed since.
+
+        Args:
+            keys (list): The keys to look up.
+            default: The value of the keys which are not found.
+
+        Returns:
+            A list of the values of `keys`.
+        """
+        groups = self._group(keys)
+        ranks = list(groups.keys())
+        cached_ranks = [rank for rank in ranks if rank in self._cache]
+        if len(cached_ranks) > 0:
+            versions = AddressArray(self.version_addrs.addrs[cached_ranks]).fetch_add(0)
+            for rank, version in zip(cached_ranks, versions):
+                if self._cache[rank][0] != version:
+                    del self._cache[rank]
+
+        values = {}
+        requests = {}
+        for rank in ranks:
+            cached = self._cache.get(rank, (None, {}))[1]
+            missing = [key for key in groups[rank] if key not in cached]
+            values.update((key, cached[key]) for key in groups[rank] if key in cached)
+            if len(missing) > 0:
+                requests[rank] = missing
+
+        if len(requests) > 0:
+            reply_id = (self.dict_id, get_my_rank(), next(_rpc_dict_ids))
+            _rpc_dict_replies[reply_id] = []
+            replied = And(len(requests))
+            for rank, missing in requests.items():
+                _rpc_dict_get(THERE(rank), self.dict_id, missing, 
+                               int(self.version_addrs.addrs[rank]), get_my_rank(), 
+                               reply_id, replied)
+            replied.wait()
+            replied.delete()
+            for rank, version, found in _rpc_dict_replies.pop(reply_id):
+                values.update(found)
+                cached = self._cache.get(rank)
+                if cached is not None and cached[0] == version:
+                    cached[1].update(found)
+                else:
+                    self._cache[rank] = (version, found)
+
+        return [values.get(key, default) for key in keys]
+
+    def put(self, key, value):
+        """ Insert or update one entry. See `RPCDict.put_many`.
+        """
+        self.put_many({key: value})
+
+    def get(self, key, default=None):
+        """ Look up one key. See `RPCDict.get_many`.
+        """
+        return self.get_many([key], default)[0]
+
+    def free(self):
+        """ Delete the shards on all localities and free the version counters.
+        """
+        _rpc_dict_delete(NULL(), self.dict_id, sync='rsync')
+        for memory in self._versions:
+            memory.free_sync()
+        self._cache = {}
+
+# }}}
+
+# {{{ TaskPool
+
+# the task queues of all TaskPool objects on this locality, keyed by the id of the pool
+_task_pools = {}
+_task_pool_ids = itertools.count()
+
+# the maximum number of yields of an idle worker between two steal attempts
+_TASK_POOL_MAX_BACKOFF = 64
+
+class _TaskQueue:
+    # deque.append and deque.pop are atomic, so the queue is shared without a lock
+    def __init__(self, counter_addr):
+        self.tasks = deque()
+        self.counter = GlobalAddress(counter_addr)
+        self.stopped_run = -1
+
+@create_action()
+def _task_pool_create(pool_id, counter_addr):
+    _task_pools[pool_id] = _TaskQueue(counter_addr)
+    return SUCCESS
+
+@create_action()
+def _task_pool_delete(pool_id):
+    _task_pools.pop(pool_id, None)
+    return SUCCESS
+
+@create_action()
+def _task_pool_stop(pool_id, run_id):
+    queue = _task_pools[pool_id]
+    queue.stopped_run = max(queue.stopped_run, run_id)
+    return SUCCESS
+
+@create_action()
+def _task_pool_steal(pool_id, thief_rank, batch, reply_lco):
+    # the oldest tasks are stolen, they tend to carry the most work
+    queue = _task_pools[pool_id]
+    stolen = []
+    while len(stolen) < batch and len(queue.tasks) > 1:
+        try:
+            stolen.append(queue.tasks.popleft())
+        except IndexError:
+            break
+    _task_pool_give(THERE(thief_rank), pool_id, stolen, rsync_lco=reply_lco)
+    return SUCCESS
+
+@create_action()
+def _task_pool_give(pool_id, tasks):
+    _task_pools[pool_id].tasks.extend(tasks)
+    return SUCCESS
+
+@create_action()
+def _task_pool_work(pool_id, run_id, done, steal_batch):
+    queue = _task_pools[pool_id]
+    my_rank = get_my_rank()
+    num_ranks = get_num_ranks()
+    backoff = 1
+    while queue.stopped_run < run_id:
+        try:
+            action, args = queue.tasks.pop()
+        except IndexError:
+            if num_ranks > 1:
+                victim = random.randrange(num_ranks - 1)
+                if victim >= my_rank:
+                    victim += 1
+                reply = Future()
+                _task_pool_steal(THERE(victim), pool_id, my_rank, steal_batch, reply)
+                reply.wait()
+                reply.delete()
+            if len(queue.tasks) > 0:
+                backoff = 1
+                continue
+            # every failed steal doubles the wait before the next one
+            for i in range(backoff):
+                if len(queue.tasks) > 0 or queue.stopped_run >= run_id:
+                    break
+                thread_yield()
+            backoff = min(2 * backoff, _TASK_POOL_MAX_BACKOFF)
+            continue
+        backoff = 1
+        action._python_func(*args)
+        if queue.counter.fetch_add(-1) == 1:
+            done.set()
+    return SUCCESS
+
+class TaskPool:
+
+    def __init__(self, steal_batch=8):
+        """ Create a pool of tasks which are load balanced across all localities.
+
+        Tasks are pushed to the queue of the locality pushing them and run by one 
+        worker per locality. An idle worker steals up to `steal_batch` of the 
+        oldest tasks from a random locality, and waits exponentially longer after
+        every failed steal. The number of outstanding tasks is counted by an int64
+        in the global address space, and the termination of a run is detected when
+        it drops to zero.
+
+        This is a collective operation which creates a queue on every locality.
+
+        Args:
+            steal_batch (int): The maximum number of tasks moved by one steal.
+        """
+        self.pool_id = (get_my_rank(), next(_task_pool_ids))
+        self.steal_batch = steal_batch
+        self._counter = GlobalMemory.calloc_local_at(1, 1, np.dtype(np.int64), HERE())
+        self._runs = 0
+        _task_pool_create(NULL(), self.pool_id, self._counter.addr.addr, sync='rsync')
+
+    def push(self, action, *args):
+        """ Push a task to the queue of the current locality.
+
+        This can be called from a running task to spawn more tasks.
+
+        Args:
+            action (Action): A marshalled, non-pinned action. A task calls its 
+                Python function directly in the worker, and the return value is 
+                ignored.
+            *args: The arguments of the task.
+        """
+        if action.marshalled != 'true' or action.pinned or action.vectored:
+            raise ValueError("TaskPool only supports non-pinned marshalled actions")
+        # count the task before it can run, so the count cannot drop to zero early
+        GlobalAddress(self._counter.addr.addr).fetch_add(1)
+        _task_pools[self.pool_id].tasks.append((action, args))
+
+    def run(self, action, *args):
+        """ Run `action` as the first task and wait until all tasks have completed.
+
+        Args:
+            action (Action): The action of the first task. See `TaskPool.push`.
+            *args: The arguments of the first task.
+        """
+        run_id = self._runs
+        self._runs += 1
+        done = Future()
+        self.push(action, *args)
+        finished = And(get_num_ranks())
+        for rank in range(get_num_ranks()):
+            _task_pool_work(THERE(rank), self.pool_id, run_id, done, self.steal_batch,
+                            rsync_lco=finished)
+        done.wait()
+        done.delete()
+        _task_pool_stop(NULL(), self.pool_id, run_id, sync='rsync')
+        finished.wait()
+        finished.delete()
+
+    def free(self):
+        """ Delete the queues on all localities and free the task counter.
+        """
+        _task_pool_delete(NULL(), self.pool_id, sync='rsync')
+        self._counter.free_sync()
+
+# }}}
+
 # {{{ Threads
 
 def thread_continue(type, *args):
@@ -1365,6 +3731,11 @@ def thread_continue(type, *args):
 def thread_current_target():
     return lib.hpx_thread_current_target()
 
+def thread_yield():
+    """ Yield the current thread, so other threads of this locality can run.
+    """
+    lib.hpx_thread_yield()
+
 # }}}
 
 # {{{ Logging
@@ -1408,7 +3779,7 @@ def time_elapsed_ms(from_time):
 
 # {{{ Error handling
 
-def HPXError(Exception):
+class HPXError(Exception):
     """ Base class for exceptions in HPX runtime
     """
     pass
@@ -13,6 +13,45 @@ def main_action():
     assert global_addr - global_memory.addr == 2*np.dtype(np.int).itemsize
     assert (global_addr - 2*np.dtype(np.int).itemsize).addr == global_memory.addr.addr
 
+    # chained displacement resolves to the same address as a single one
+    chained_addr = global_memory.addr + np.dtype(np.int).itemsize + np.dtype(np.int).itemsize
+    assert chained_addr.addr == global_addr.addr
+    assert chained_addr == global_addr
+    assert chained_addr != global_memory.addr
+    assert {global_addr: 1}[chained_addr] == 1
+    assert chained_addr - global_memory.addr == 2*np.dtype(np.int).itemsize
+
+    # test AddressArray
+    itemsize = np.dtype(np.int).itemsize
+    addrs = hpx.AddressArray.from_offsets(global_memory.addr, np.arange(3)*4*itemsize)
+    assert len(addrs) == 3
+    assert addrs[1].addr == global_memory[1].addr.addr
+    assert (addrs + itemsize)[2].addr == global_memory[2, 1].addr.addr
+    assert np.all(addrs.owners() == hpx.get_my_rank())
+    addrs.set(np.arange(3))
+    assert np.array_equal(addrs.get(np.dtype(np.int)), np.arange(3))
+
+    # test remote atomics
+    counters = hpx.GlobalMemory.calloc_cyclic(4, 2, np.dtype(np.int64))
+    counter = counters[0, 0].addr
+    assert counter.fetch_add(5) == 0
+    assert counter.fetch_add(-2) == 5
+    assert counter.cas(3, 10) == 3
+    assert counter.cas(3, 11) == 10
+    counter_addrs = hpx.AddressArray([block.addr.addr for block in counters.blocks()],
+                                     counters.addr.bsize)
+    assert np.array_equal(counter_addrs.fetch_add(np.arange(4)), [10, 0, 0, 0])
+    assert np.array_equal(counter_addrs.cas(np.arange(4), 7), [10, 1, 2, 3])
+    counter_addrs.atomic_accumulate(np.ones((4, 2), dtype=np.int64))
+    counter_addrs[1].atomic_accumulate(np.array([10, -10], dtype=np.int64), op='max')
+    assert np.array_equal(counters.get(), [[11, 1], [10, 1], [8, 1], [8, 1]])
+    counters.free_sync()
+
+    sums = hpx.GlobalMemory.calloc_cyclic(2, 1, np.dtype(np.float64))
+    sums[1, 0].addr.fetch_add(0.5, np.float64)
+    assert sums[1, 0].addr.fetch_add(0.25, np.float64) == 0.5
+    sums.free_sync()
+
     hpx.exit()
 
 hpx.init()
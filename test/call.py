@@ -39,6 +39,45 @@ def main():
     assert np.array_equal(out_array, np.arange(12).reshape((3,4)))
     future1.delete()
 
+    # test typed action with an LCO argument
+    future = hpx.Future()
+    typed_set_lco(hpx.HERE(), 3, 0.5, 2**40, future)
+    future.wait()
+    future.delete()
+    future = hpx.Future()
+    typed_long_double(hpx.HERE(), 0.25, future)
+    future.wait()
+    future.delete()
+
+    # test vectored action
+    check_vectored(hpx.HERE(), np.arange(6).reshape((2, 3)), np.ones(4), sync='rsync')
+
+    # test broadcast to a subset of ranks
+    counters = hpx.GlobalMemory.calloc_local_at(1, 1, np.dtype(np.int64), hpx.HERE())
+    num_ranks = hpx.get_num_ranks()
+    count_broadcast.broadcast(counters.addr, np.ones(3), topology='tree')
+    assert counters.addr.fetch_add(0) == num_ranks
+    count_broadcast.broadcast(counters.addr, np.ones(3), ranks=range(0, num_ranks, 2), 
+                              topology='flat')
+    assert counters.addr.fetch_add(0) == num_ranks + len(range(0, num_ranks, 2))
+    count_broadcast.broadcast(counters.addr, np.ones(3), ranks=[0, 0, num_ranks - 1])
+    assert counters.addr.fetch_add(0) == (num_ranks + len(range(0, num_ranks, 2)) +
+                                          len({0, num_ranks - 1}))
+    counters.free_sync()
+
+    # test typed action with two arguments launched on an AddressArray
+    counters = hpx.GlobalMemory.calloc_cyclic(num_ranks, 1, np.dtype(np.int64))
+    counter_addrs = hpx.AddressArray([block.addr.addr for block in counters.blocks()],
+                                     counters.addr.bsize)
+    typed_count(counter_addrs, 3, 0.5, sync='rsync')
+    assert np.array_equal(counters.get().reshape(-1), np.full(num_ranks, 3))
+    done = hpx.And(num_ranks)
+    typed_count(counter_addrs, 2, 0.5, sync='lsync', rsync_lco=done)
+    done.wait()
+    done.delete()
+    assert np.array_equal(counters.get().reshape(-1), np.full(num_ranks, 5))
+    counters.free_sync()
+
     rtv = np.arange(6).reshape((2, 3))
     hpx.exit(rtv)
 
@@ -71,6 +110,42 @@ def set_funture_2(future):
     future.set(starray)
     return hpx.SUCCESS
 
+@hpx.create_action(marshalled='false', argument_types=[hpx.Type.INT, hpx.Type.DOUBLE, 
+                   hpx.Type.SINT64, (hpx.Type.LCO, None)])
+def typed_set_lco(int_arg, double_arg, int64_arg, lco):
+    assert int_arg == 3
+    assert double_arg == 0.5
+    assert int64_arg == 2**40
+    lco.set()
+    return hpx.SUCCESS
+
+@hpx.create_action(marshalled='false', argument_types=[hpx.Type.SINT64, hpx.Type.DOUBLE])
+def typed_count(int_arg, double_arg):
+    assert double_arg == 0.5
+    hpx.GlobalAddress(hpx.thread_current_target()).fetch_add(int_arg)
+    return hpx.SUCCESS
+
+@hpx.create_action(marshalled='false', argument_types=[hpx.Type.LONGDOUBLE,
+                   (hpx.Type.LCO, None)])
+def typed_long_double(long_double_arg, lco):
+    assert type(long_double_arg) is float
+    assert long_double_arg == 0.25
+    lco.set()
+    return hpx.SUCCESS
+
+@hpx.create_action()
+def count_broadcast(counter, payload):
+    assert np.array_equal(payload, np.ones(3))
+    counter.fetch_add(1)
+    return hpx.SUCCESS
+
+@hpx.create_action(vectored=True)
+def check_vectored(arrays):
+    assert len(arrays) == 2
+    assert np.array_equal(arrays[0], np.arange(6).reshape((2, 3)))
+    assert np.array_equal(arrays[1], np.ones(4))
+    return hpx.SUCCESS
+
 if __name__ == '__main__':
     hpx.init()
     rtv = hpx.run(main, shape=(2, 3), dtype=np.dtype(int))
@@ -0,0 +1,33 @@
+# Smoke check for source/build_cffi.py which runs without HPX installed: the
+# cdef declarations must parse, and every pyhpx helper declared there must be
+# defined in the set_source code.
+import ast
+import os
+import re
+import warnings
+from cffi import FFI
+
+build_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'source',
+                            'build_cffi.py')
+with open(build_script) as f:
+    tree = ast.parse(f.read())
+
+sources = {}
+for node in ast.walk(tree):
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ('cdef', 'set_source')):
+        sources[node.func.attr] = node.args[-1].value if node.func.attr == 'cdef' \
+            else node.args[1].value
+
+cdef = sources['cdef']
+with warnings.catch_warnings():
+    # the baseline declares its lvalue globals without 'extern'
+    warnings.simplefilter('ignore', UserWarning)
+    FFI().cdef(cdef)
+
+declared = set(re.findall(r'\b(pyhpx_\w+)\s*\(', cdef))
+defined = set(re.findall(r'^[\w ]+\*?\s*(pyhpx_\w+)\s*\([^;]*?\)\s*\{', sources['set_source'],
+                         re.MULTILINE | re.DOTALL))
+missing = declared - defined
+assert not missing, "declared but not defined: {0}".format(sorted(missing))
+print("cdef ok: {0} pyhpx helpers".format(len(declared)))
@@ -0,0 +1,57 @@
+import hpx
+import numpy as np
+import os
+import shutil
+import tempfile
+
+@hpx.create_action()
+def main():
+    path = os.path.join(tempfile.gettempdir(), 'pyhpx_test_checkpoint')
+    num_ranks = hpx.get_num_ranks()
+
+    grid = hpx.GlobalMemory.alloc_cyclic(2 * num_ranks, (3, 4), np.float64)
+    grid_data = np.arange(2 * num_ranks * 12, dtype=np.float64).reshape((2 * num_ranks, 3, 4))
+    grid.set(grid_data)
+    counts = hpx.GlobalMemory.alloc_blocked((num_ranks, 2), 5, np.int64)
+    counts_data = np.arange(num_ranks * 10, dtype=np.int64).reshape((num_ranks, 2, 5))
+    counts.set(counts_data)
+
+    # overlap the checkpoint with unrelated work, then wait
+    done = hpx.checkpoint(path, {'grid': grid, 'counts': counts}, sync='async')
+    assert os.path.exists(os.path.join(path, 'manifest.json'))
+    done.wait()
+    done.delete()
+
+    # a given LCO is set once, however many ranks write files
+    future = hpx.Future()
+    assert hpx.checkpoint(path, {'grid': grid, 'counts': counts}, sync='async',
+                          lco=future) is future
+    future.wait()
+    future.delete()
+
+    restored = hpx.restore(path)
+    assert sorted(restored) == ['counts', 'grid']
+    assert restored['grid'].numBlock == (2 * num_ranks,)
+    assert restored['counts'].numBlock == (num_ranks, 2)
+    assert restored['counts'].dtype == np.int64
+    assert np.array_equal(restored['grid'].get(), grid_data)
+    assert np.array_equal(restored['counts'].get(), counts_data)
+
+    # blocks are restored on the ranks which owned them
+    for name, memory in (('grid', grid), ('counts', counts)):
+        before = hpx.AddressArray([b.addr.addr for b in memory.blocks()]).owners()
+        after = hpx.AddressArray([b.addr.addr for b in restored[name].blocks()]).owners()
+        assert np.array_equal(before, after)
+
+    only_grid = hpx.restore(path, names=['grid'])
+    assert list(only_grid) == ['grid']
+    assert np.array_equal(only_grid['grid'].get(), grid_data)
+
+    for memory in [grid, counts, only_grid['grid']] + list(restored.values()):
+        memory.free_sync()
+    shutil.rmtree(path)
+    hpx.exit()
+
+hpx.init()
+hpx.run(main)
+hpx.finalize()
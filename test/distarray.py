@@ -0,0 +1,69 @@
+import hpx
+import numpy as np
+
+@hpx.create_action()
+def main():
+    local = np.arange(10, dtype=np.float64)
+    x = hpx.DistArray.from_numpy(local, block_rows=3)
+    assert x.shape == (10,)
+    assert x.num_blocks == 4
+    assert len(x.block_owners) == 4
+    assert np.array_equal(x.to_numpy(), local)
+
+    # test slicing
+    assert x[4] == 4.0
+    assert x[-1] == 9.0
+    assert np.array_equal(x[2:8], local[2:8])
+    assert x[5:5].shape == (0,)
+
+    # test elementwise operations
+    y = x * 2 + 1
+    assert np.array_equal(y.to_numpy(), local * 2 + 1)
+    z = y - x
+    assert np.array_equal(z.to_numpy(), local + 1)
+
+    # test reductions
+    assert z.sum() == np.sum(local + 1)
+    assert z.min() == 1.0
+    assert z.max() == 10.0
+
+    # test an explicit output array
+    out = hpx.DistArray.empty(10, np.float64, block_rows=3)
+    assert x.map(np.add, y, out=out) is out
+    assert np.array_equal(out.to_numpy(), local * 3 + 1)
+    for bad_out in (hpx.DistArray.empty(10, np.float64, block_rows=5),
+                    hpx.DistArray.empty(10, np.int64, block_rows=3)):
+        try:
+            x.map(np.add, y, out=bad_out)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("map should reject a mismatched 'out'")
+        bad_out.free()
+
+    # reductions skip blocks without rows
+    empty = hpx.DistArray.from_numpy(np.zeros(0))
+    assert empty.sum() == 0
+    try:
+        empty.min()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("min of an empty DistArray should raise")
+
+    # test a two dimensional array
+    local_2d = np.arange(12, dtype=np.int64).reshape((4, 3))
+    w = hpx.DistArray.from_numpy(local_2d)
+    assert np.array_equal(w.to_numpy(), local_2d)
+    assert np.array_equal(w[1:3, 1], local_2d[1:3, 1])
+    assert w.sum() == np.sum(local_2d)
+    assert w.max() == 11
+
+    for array in (x, y, z, w, out, empty):
+        array.free()
+
+    hpx.exit()
+
+hpx.init()
+hpx.run(main)
+hpx.finalize()
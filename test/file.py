@@ -0,0 +1,41 @@
+import hpx
+import numpy as np
+import os
+import tempfile
+
+@hpx.create_action()
+def main():
+    path = os.path.join(tempfile.gettempdir(), 'pyhpx_test_file.bin')
+    data = np.arange(6 * 4 * 2, dtype=np.float64).reshape((6, 4, 2))
+    data.tofile(path)
+
+    memory = hpx.GlobalMemory.from_file(path, np.float64, (4, 2))
+    assert memory.numBlock == (6,)
+    assert np.array_equal(memory.get(), data)
+
+    blocked = hpx.GlobalMemory.from_file(path, np.float64, (4, 2), distribution='blocked')
+    assert np.array_equal(blocked.get(), data)
+    blocked.free_sync()
+
+    # write back a modified copy, including a strided view of the blocks
+    memory.set(data + 1)
+    memory.to_file(path)
+    assert np.array_equal(np.fromfile(path, dtype=np.float64).reshape((6, 4, 2)), data + 1)
+    memory[:, 1:3].to_file(path, offset=8)
+    header_and_data = np.fromfile(path, dtype=np.float64)
+    assert np.array_equal(header_and_data[1:].reshape((6, 2, 2)), (data + 1)[:, 1:3])
+
+    try:
+        hpx.GlobalMemory.from_file(path, np.float64, (5, 5))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("from_file should reject a partial block")
+
+    memory.free_sync()
+    os.remove(path)
+    hpx.exit()
+
+hpx.init()
+hpx.run(main)
+hpx.finalize()
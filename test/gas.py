@@ -1,6 +1,28 @@
 import hpx
 import numpy as np
 
+@hpx.create_action(marshalled='continuous', pinned=True, array_type=np.dtype(np.int))
+def add_to_block(block, array):
+    block += array.reshape(block.shape)
+    return hpx.SUCCESS
+
+@hpx.create_action(pin_cache=True)
+def count_pins(block):
+    # every pin in the scope returns the same view
+    views = [block.try_pin() for i in range(3)]
+    for view in views:
+        block.unpin()
+    assert all(view is views[0] for view in views)
+    return hpx.SUCCESS
+
+@hpx.create_action()
+def pin_outside_cache(block):
+    # the pin cache of a blocked caller is not visible to other HPX threads
+    block.try_pin()
+    block.unpin()
+    assert hpx._active_pin_cache() is None
+    return hpx.SUCCESS
+
 @hpx.create_action()
 def main():
     test_memory = hpx.GlobalMemory.alloc_local_at(3, (4,5), np.dtype(np.int), hpx.HERE())
@@ -92,6 +114,15 @@ def main():
     assert array[0, 0] == 5
     assert array[1, 1] == 10
 
+    # test async get into a preallocated array
+    out_array = np.empty((4,5), dtype=np.int)
+    array, get_lco = test_memory[1].get(sync='async', out_array=out_array)
+    get_lco.wait()
+    get_lco.delete()
+    assert array is out_array
+    assert array[0, 0] == 5
+    assert array[1, 1] == 10
+
     # test set
     from_array = np.array([6,11])
     test_memory[2,0,2:4].set(from_array, sync='rsync') # test_memory[2,0,2:4] = [6,11]
@@ -99,20 +130,17 @@ def main():
     assert array[0, 2] == 6
     assert array[0, 3] == 11
 
-    # when get and set on not contiguous gas, RuntimeError should be raised
-    try:
-        array = test_memory[1,:2,1:].get(sync='sync')
-    except RuntimeError:
-        pass
-    else:
-        raise RuntimeError("Runtime error not raised!")
-
-    try:
-        test_memory[1,:2,1].set(from_array, sync='rsync')
-    except RuntimeError:
-        pass
-    else:
-        raise RuntimeError("Runtime error not raised!")
+    # test get and set on not contiguous gas
+    array = test_memory[1,:2,1:].get(sync='sync')
+    assert array.shape == (2, 4)
+    assert array[1, 0] == 10
+    test_memory[1,:2,1].set(from_array, sync='rsync') # test_memory[1,:2,1] = [6,11]
+    assert np.array_equal(test_memory[1,:2,1].get(sync='sync'), from_array)
+    array, get_lco = test_memory[1,:2,1:].get(sync='async')
+    get_lco.wait()
+    get_lco.delete()
+    assert array[0, 0] == 6
+    assert array[1, 0] == 11
 
     # test get and set on array with some dimension of size 1
     test_memory_2 = hpx.GlobalMemory.alloc_local_at(2, (2,2,2,2,2), np.dtype(np.int), hpx.HERE())
@@ -121,6 +149,109 @@ def main():
     get_array = test_memory_2[1,1,0,:,:,:].get(sync='sync')
     assert np.array_equal(get_array[1], from_array)
 
+    # test get and set over many blocks
+    test_memory_4 = hpx.GlobalMemory.alloc_cyclic(4, (3,2), np.dtype(np.int))
+    from_array = np.arange(24).reshape((4,3,2))
+    test_memory_4.set(from_array)
+    assert np.array_equal(test_memory_4.get(), from_array)
+    assert np.array_equal(test_memory_4[1:3, :, 1].get(), from_array[1:3, :, 1])
+    test_memory_4[1:3, :, 1].set(np.zeros((2,3), dtype=np.int))
+    from_array[1:3, :, 1] = 0
+    assert np.array_equal(test_memory_4.get(), from_array)
+    test_memory_4.free_sync()
+
+    # test pinned continuous action launched on every block
+    test_memory_3 = hpx.GlobalMemory.calloc_cyclic(2, (2,3), np.dtype(np.int))
+    add_to_block(test_memory_3, np.arange(6), sync='rsync')
+    for block in test_memory_3.blocks():
+        assert np.array_equal(block.get(), np.arange(6).reshape((2,3)))
+    test_memory_3.free_sync()
+
+    # test blocked and user-defined distributions
+    num_ranks = hpx.get_num_ranks()
+    blocked_memory = hpx.GlobalMemory.calloc_blocked(2*num_ranks, 3, np.dtype(np.int))
+    owners = hpx.AddressArray([block.addr.addr for block in blocked_memory.blocks()],
+                              blocked_memory.addr.bsize).owners()
+    assert np.array_equal(owners, np.arange(2*num_ranks) // 2)
+    assert np.array_equal(blocked_memory.get(), np.zeros((2*num_ranks, 3)))
+    blocked_memory.free_sync()
+
+    user_memory = hpx.GlobalMemory.alloc_user(4, 3, np.dtype(np.int), 
+                                              lambda i, n: num_ranks - 1, zeroed=True)
+    owners = hpx.AddressArray([block.addr.addr for block in user_memory.blocks()],
+                              user_memory.addr.bsize).owners()
+    assert np.all(owners == num_ranks - 1)
+    assert np.array_equal(user_memory.get(), np.zeros((4, 3)))
+    user_memory.free_sync()
+
+    for bad_rank in (-1, num_ranks):
+        try:
+            hpx.GlobalMemory.alloc_user(4, 3, np.dtype(np.int), lambda i, n: bad_rank)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("alloc_user should reject rank {0}".format(bad_rank))
+
+    local_memory = hpx.GlobalMemory.calloc_local_at(2, 3, np.dtype(np.int), hpx.HERE())
+    assert np.array_equal(local_memory.get(), np.zeros((2, 3)))
+    local_memory.free_sync()
+
+    # test asynchronous allocation
+    memory_future = hpx.GlobalMemory.alloc_local_at(2, 3, np.dtype(np.int), hpx.HERE(), 
+                                                    sync='async')
+    memory_future.wait()
+    async_memory = memory_future.get()
+    assert async_memory.numBlock == (2,)
+    assert async_memory.blockShape == (3,)
+    async_memory.set(np.arange(6).reshape((2, 3)))
+    assert np.array_equal(async_memory.get(), np.arange(6).reshape((2, 3)))
+    assert memory_future.get() is async_memory
+    async_memory.free_sync()
+
+    # test views of pinned blocks
+    block = test_memory[0][1:3, 1:4]
+    view = block.try_pin()
+    block.unpin()
+    assert view.shape == (2, 3)
+    assert view.strides == block.strides
+    assert block.try_pin() is view
+    block.unpin()
+    view[:] = 3
+    assert np.all(block.get() == 3)
+
+    # test copies between global blocks
+    copy_memory = hpx.GlobalMemory.calloc_cyclic(3, (4,5), np.dtype(np.int))
+    test_memory[1].set(np.arange(20).reshape((4,5)))
+    test_memory[1].copy_to(copy_memory[2])
+    assert np.array_equal(copy_memory[2].get(), np.arange(20).reshape((4,5)))
+    copy_done = hpx.Future()
+    test_memory[1][1:3, 1:4].copy_to(copy_memory[0][:2, :3], sync='async', rsync_lco=copy_done)
+    copy_done.wait()
+    copy_done.delete()
+    assert np.array_equal(copy_memory[0][:2, :3].get(), np.arange(20).reshape((4,5))[1:3, 1:4])
+    test_memory.copy_to(copy_memory)
+    assert np.array_equal(copy_memory.get(), test_memory.get())
+    copy_memory.free_sync()
+
+    # test scoped pinning and the pin cache
+    with test_memory[0].pinned() as array:
+        array[:] = 7
+    assert np.all(test_memory[0].get() == 7)
+    with hpx.PinCache() as cache:
+        first = test_memory[0].try_pin()
+        test_memory[0].unpin()
+        assert cache.holds(test_memory[0].addr.addr)
+        assert test_memory[0].try_pin() is first
+        pin_outside_cache(hpx.HERE(), test_memory[0], sync='rsync')
+        assert hpx._active_pin_cache() is cache
+    assert not cache.holds(test_memory[0].addr.addr)
+    count_pins(hpx.HERE(), test_memory[0], sync='rsync')
+    try:
+        with test_memory[1].pinned() as array:
+            raise ValueError()
+    except ValueError:
+        pass
+
     # test free
     test_memory.free_sync()
     
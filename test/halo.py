@@ -0,0 +1,49 @@
+import hpx
+import numpy as np
+
+@hpx.create_action()
+def main():
+    # four blocks of 3 interior rows with a ghost row on each side
+    memory = hpx.GlobalMemory.calloc_cyclic(4, (5, 2), np.dtype(np.int64))
+    interior = np.arange(24).reshape((4, 3, 2))
+    local = np.zeros((4, 5, 2), dtype=np.int64)
+    local[:, 1:4] = interior
+    memory.set(local)
+
+    done = hpx.halo_exchange(memory, 1)
+    done.wait()
+    done.delete()
+    result = memory.get()
+    assert np.array_equal(result[1:, 0], interior[:-1, 2])
+    assert np.array_equal(result[:-1, 4], interior[1:, 0])
+    assert np.all(result[0, 0] == 0)
+    assert np.all(result[-1, 4] == 0)
+
+    done = hpx.halo_exchange(memory, 1, periodic=True)
+    done.wait()
+    done.delete()
+    result = memory.get()
+    assert np.array_equal(result[0, 0], interior[-1, 2])
+    assert np.array_equal(result[-1, 4], interior[0, 0])
+    memory.free_sync()
+
+    # a 2 x 2 grid of 2 x 2 interiors with a ghost region of width 1
+    memory_2d = hpx.GlobalMemory.calloc_cyclic((2, 2), (4, 4), np.dtype(np.float64))
+    local_2d = np.zeros((2, 2, 4, 4))
+    local_2d[:, :, 1:3, 1:3] = np.arange(16).reshape((2, 2, 2, 2))
+    memory_2d.set(local_2d)
+    done = hpx.halo_exchange(memory_2d, 1)
+    done.wait()
+    done.delete()
+    result = memory_2d.get()
+    assert np.array_equal(result[1, 0, 0, 1:3], local_2d[0, 0, 2, 1:3])
+    assert np.array_equal(result[0, 1, 1:3, 0], local_2d[0, 0, 1:3, 2])
+    assert np.array_equal(result[0, 0, 1:3, 3], local_2d[0, 1, 1:3, 1])
+    assert result[1, 1, 0, 0] == 0
+    memory_2d.free_sync()
+
+    hpx.exit()
+
+hpx.init()
+hpx.run(main)
+hpx.finalize()
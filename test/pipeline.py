@@ -0,0 +1,33 @@
+import hpx
+import numpy as np
+
+@hpx.create_action()
+def double(chunk):
+    return chunk * 2
+
+@hpx.create_action()
+def row_sums(chunk):
+    return chunk.sum(axis=1)
+
+@hpx.create_action()
+def main():
+    num_ranks = hpx.get_num_ranks()
+    data = np.arange(100 * 3, dtype=np.float64).reshape((100, 3))
+
+    results = hpx.pipeline([double, (row_sums, num_ranks - 1)], data, depth=3, 
+                           chunk_rows=16)
+    assert len(results) == 7
+    assert np.array_equal(np.concatenate(results), (data * 2).sum(axis=1))
+
+    # results are handed to the sink in order
+    seen = []
+    hpx.pipeline([(double, 0)], iter([np.ones(2), np.zeros(2)]), depth=1,
+                 sink=lambda index, result: seen.append((index, result)))
+    assert [index for index, result in seen] == [0, 1]
+    assert np.array_equal(seen[0][1], 2 * np.ones(2))
+
+    hpx.exit()
+
+hpx.init()
+hpx.run(main)
+hpx.finalize()
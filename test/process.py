@@ -0,0 +1,30 @@
+import hpx
+import numpy as np
+
+@hpx.create_action()
+def spawn(counter, depth):
+    counter.fetch_add(1)
+    if depth > 0:
+        for i in range(hpx.get_num_ranks()):
+            spawn(hpx.THERE(i), counter, depth - 1)
+    return hpx.SUCCESS
+
+@hpx.create_action()
+def main():
+    counter_memory = hpx.GlobalMemory.calloc_local_at(1, 1, np.dtype(np.int64), hpx.HERE())
+    counter = counter_memory.addr
+
+    # the termination LCO waits for all transitively spawned actions
+    process = hpx.Process()
+    process.call(hpx.HERE(), spawn, counter, 3)
+    process.wait()
+    num_ranks = hpx.get_num_ranks()
+    assert counter.fetch_add(0) == sum(num_ranks**i for i in range(4))
+    process.delete()
+
+    counter_memory.free_sync()
+    hpx.exit()
+
+hpx.init()
+hpx.run(main)
+hpx.finalize()
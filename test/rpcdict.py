@@ -0,0 +1,28 @@
+import hpx
+import numpy as np
+
+@hpx.create_action()
+def main():
+    table = hpx.RPCDict()
+    items = {'key{0}'.format(i): i for i in range(100)}
+    table.put_many(items)
+    assert table.get_many(list(items.keys())) == list(items.values())
+    assert table.get('key7') == 7
+    assert table.get('missing') is None
+    assert table.get('missing', -1) == -1
+    assert 0 <= table.owner('key7') < hpx.get_num_ranks()
+
+    # cached values are invalidated by updates
+    assert table.get('key8') == 8
+    table.put('key8', 80)
+    assert table.get('key8') == 80
+    table.put_many({(1, 2): np.arange(3), 'key9': 'nine'})
+    assert np.array_equal(table.get((1, 2)), np.arange(3))
+    assert table.get_many(['key9', 'key8', 'key0']) == ['nine', 80, 0]
+
+    table.free()
+    hpx.exit()
+
+hpx.init()
+hpx.run(main)
+hpx.finalize()
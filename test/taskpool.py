@@ -0,0 +1,31 @@
+import hpx
+import numpy as np
+
+@hpx.create_action()
+def count_down(pool, counter, n):
+    counter.fetch_add(1)
+    if n > 0:
+        pool.push(count_down, pool, counter, n - 1)
+        pool.push(count_down, pool, counter, n - 1)
+
+@hpx.create_action()
+def main():
+    counter_memory = hpx.GlobalMemory.calloc_local_at(1, 1, np.dtype(np.int64), hpx.HERE())
+    counter = counter_memory.addr
+    pool = hpx.TaskPool(steal_batch=4)
+
+    # a full binary tree of depth 8 has 511 nodes
+    pool.run(count_down, pool, counter, 8)
+    assert counter.fetch_add(0) == 511
+
+    # a pool can run more than once
+    pool.run(count_down, pool, counter, 2)
+    assert counter.fetch_add(0) == 518
+
+    pool.free()
+    counter_memory.free_sync()
+    hpx.exit()
+
+hpx.init()
+hpx.run(main)
+hpx.finalize()